@@ -3,42 +3,125 @@ data-tool: Data Preprocessing Toolkit
 
 Provides:
 - handle_missing_values: Handle missing data
-- remove_duplicates: Remove duplicate rows
+- remove_duplicates: Remove duplicate rows (exact or MinHash near-duplicates)
+- near_duplicate_groups: Label groups of near-duplicate rows
 - clip_outliers: Clip extreme values
 - one_hot_encode: One-hot encoding for categorical features
 - label_encode: Label encoding for categorical features
+- hash_encode: Feature hashing for high-cardinality categorical features
 - minmax_scale: Min-max scaling
 - standard_scale: Standardization (z-score)
 - robust_scale: Robust scaling
+- fused_numeric_transform: Impute, clip and scale numeric columns in one pass
+- run_pipeline: Overlap chunked reading, transforming and writing with asyncio
+- apply_with_memory_limit: Run a step within a memory budget, chunking as needed
+- run_incremental: Recompute only changed partitions of append-only datasets
+- apply_dask: Partition-parallel execution on Dask DataFrames
+- make_dataset: Synthetic data with controlled missingness, outliers and duplicates
+- scaling_report: Time and memory scaling curves of every transform
+- profile: One-pass mergeable column statistics reusable by every transform
 """
 
 from . import cleaning
 from . import encoding
 from . import scaling
+from . import sketches
+from . import sampling
+from . import kernels
+from . import indicators
+from . import profiling
+from . import fused
+from . import pipeline
+from . import steps
+from . import memory
+from . import incremental
+from . import distributed
+from . import datasets
+from . import benchmark
 
 from .cleaning import (
     handle_missing_values,
     remove_duplicates,
+    near_duplicate_groups,
     clip_outliers
 )
+from .indicators import MissingIndicators
 from .encoding import (
     one_hot_encode,
-    label_encode
+    label_encode,
+    hash_encode
 )
 from .scaling import (
     minmax_scale,
     standard_scale,
     robust_scale
 )
+from .fused import fused_numeric_transform
+from .pipeline import (
+    run_pipeline,
+    arun_pipeline,
+    read_chunks,
+    ChunkWriter
+)
+from .memory import (
+    apply_with_memory_limit,
+    estimate_memory,
+    choose_chunksize,
+    set_memory_limit
+)
+from .incremental import (
+    run_incremental,
+    PartitionStore
+)
+from .distributed import (
+    apply_dask,
+    profile_dask
+)
+from .datasets import (
+    make_dataset,
+    write_dataset
+)
+from .benchmark import (
+    scaling_report,
+    scaling_exponents
+)
+from .profiling import (
+    profile,
+    DataFrameProfile,
+    ColumnProfile
+)
 
 __version__ = "0.1.0"
 __all__ = [
     'handle_missing_values',
     'remove_duplicates',
+    'near_duplicate_groups',
     'clip_outliers',
+    'MissingIndicators',
     'one_hot_encode',
     'label_encode',
+    'hash_encode',
     'minmax_scale',
     'standard_scale',
-    'robust_scale'
+    'robust_scale',
+    'fused_numeric_transform',
+    'run_pipeline',
+    'arun_pipeline',
+    'read_chunks',
+    'ChunkWriter',
+    'apply_with_memory_limit',
+    'estimate_memory',
+    'choose_chunksize',
+    'set_memory_limit',
+    'run_incremental',
+    'PartitionStore',
+    'apply_dask',
+    'profile_dask',
+    'make_dataset',
+    'write_dataset',
+    'scaling_report',
+    'scaling_exponents',
+    'profile',
+    'DataFrameProfile',
+    'ColumnProfile'
 ]
@@ -0,0 +1,196 @@
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from . import kernels
+from .cleaning import handle_missing_values, remove_duplicates, clip_outliers
+from .encoding import one_hot_encode, label_encode, hash_encode
+from .scaling import minmax_scale, standard_scale, robust_scale
+from .fused import fused_numeric_transform
+from .profiling import profile
+from .datasets import make_dataset
+
+
+def default_cases(numeric, categorical):
+    """
+    Benchmark cases covering every public transform.
+
+    Returns {name: (frame, func)} where frame is 'raw' (with missing
+    values) or 'clean' (imputed) and func takes the DataFrame.
+    """
+    return {
+        'handle_missing_values': ('raw', lambda df: handle_missing_values(
+            df, strategy={**{c: 'median' for c in numeric}, **{c: 'mode' for c in categorical}})),
+        'remove_duplicates': ('raw', lambda df: remove_duplicates(df)),
+        'remove_duplicates[minhash]': ('raw', lambda df: remove_duplicates(
+            df, subset=categorical, method='minhash', num_perm=32)),
+        'clip_outliers': ('raw', lambda df: clip_outliers(df, numeric)),
+        'one_hot_encode': ('clean', lambda df: one_hot_encode(df, categorical)),
+        'one_hot_encode[max_categories]': ('clean', lambda df: one_hot_encode(
+            df, categorical, max_categories=10)),
+        'label_encode': ('clean', lambda df: label_encode(df, categorical)),
+        'hash_encode': ('clean', lambda df: hash_encode(df, categorical, n_features=64)),
+        'minmax_scale': ('clean', lambda df: minmax_scale(df, numeric)),
+        'standard_scale': ('clean', lambda df: standard_scale(df, numeric)),
+        'robust_scale': ('clean', lambda df: robust_scale(df, numeric)),
+        'fused_numeric_transform': ('raw', lambda df: fused_numeric_transform(
+            df, numeric, impute='median', clip='iqr', scale='standard')),
+        'profile': ('raw', lambda df: profile(df)),
+    }
+
+
+def _time(func, df, repeat):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(func, df):
+    tracemalloc.start()
+    try:
+        func(df)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def scaling_report(sizes=(10_000, 100_000, 1_000_000), cases=None, repeat=3,
+                   memory=True, **dataset_kwargs):
+    """
+    Time every transform on synthetic data of growing size.
+
+    Parameters:
+    sizes : sequence of int, optional
+        Row counts to benchmark
+    cases : dict, optional
+        {name: (frame, func)} as returned by ``default_cases`` (default all
+        public transforms)
+    repeat : int, optional
+        Timing repetitions per case; the best time is reported
+    memory : bool, optional
+        Also measure peak allocation with tracemalloc (in a separate run,
+        so it does not distort the timings)
+    **dataset_kwargs
+        Arguments for ``make_dataset``
+
+    Returns:
+    pandas.DataFrame
+        One row per (function, n_rows) with seconds, rows/s and peak bytes
+    """
+    rows = []
+    warmed_up = set()
+    for n in sizes:
+        raw = make_dataset(n, **dataset_kwargs)
+        numeric = [c for c in raw.columns if pd.api.types.is_numeric_dtype(raw[c])]
+        categorical = [c for c in raw.columns if c not in numeric]
+        frames = {
+            'raw': raw,
+            'clean': handle_missing_values(raw, strategy={
+                **{c: 'median' for c in numeric}, **{c: 'mode' for c in categorical}
+            })
+        }
+        selected = cases if cases is not None else default_cases(numeric, categorical)
+        for name, (frame, func) in selected.items():
+            df = frames[frame]
+            if name not in warmed_up:
+                # first call pays for imports and JIT compilation
+                func(df.head(100))
+                warmed_up.add(name)
+            seconds = _time(func, df, repeat)
+            rows.append({
+                'function': name,
+                'n_rows': n,
+                'seconds': seconds,
+                'rows_per_second': n / seconds if seconds else np.nan,
+                'peak_bytes': _peak_memory(func, df) if memory else np.nan,
+            })
+    return pd.DataFrame(rows)
+
+
+def kernel_report(n_rows=1_000_000, repeat=3, missing_rate=0.05, seed=0):
+    """
+    Time the dtype-specialized median/mode/quantile kernels against pandas.
+
+    Columns: small- and wide-range int64, small-range nullable Int64 and
+    float64 (both with ``missing_rate`` missing values) and a 50-level
+    categorical.
+
+    Returns:
+    pandas.DataFrame
+        One row per (column, statistic) with both timings and the speedup
+    """
+    rng = np.random.default_rng(seed)
+    missing = rng.random(n_rows) < missing_rate
+    columns = {
+        'int_small_range': pd.Series(rng.integers(0, 1_000, n_rows)),
+        'int_wide_range': pd.Series(rng.integers(0, 10 ** 12, n_rows)),
+        'nullable_int': pd.Series(rng.integers(0, 1_000, n_rows)).astype('Int64').mask(missing),
+        'float': pd.Series(rng.normal(size=n_rows)).mask(missing),
+        'categorical': pd.Series(rng.integers(0, 50, n_rows)).astype(str).mask(missing).astype('category'),
+    }
+    probs = [0.25, 0.75]
+    statistics = {
+        'median': (lambda s: s.median(), kernels.median),
+        'mode': (lambda s: s.mode(), kernels.mode),
+        'quantiles': (lambda s: s.quantile(probs), lambda s: kernels.quantiles(s, probs)),
+    }
+    rows = []
+    for column, series in columns.items():
+        for statistic, (reference, kernel) in statistics.items():
+            if isinstance(series.dtype, pd.CategoricalDtype) and statistic != 'mode':
+                continue
+            pandas_seconds = _time(reference, series, repeat)
+            kernel_seconds = _time(kernel, series, repeat)
+            rows.append({
+                'column': column,
+                'statistic': statistic,
+                'pandas_seconds': pandas_seconds,
+                'kernel_seconds': kernel_seconds,
+                'speedup': pandas_seconds / kernel_seconds if kernel_seconds else np.nan,
+            })
+    return pd.DataFrame(rows)
+
+
+def scaling_exponents(report, superlinear=1.2):
+    """
+    Fit ``time ~ n ** k`` (and memory likewise) per function on a log-log scale.
+
+    Returns a DataFrame with the fitted exponents and a ``superlinear``
+    flag for functions whose time exponent exceeds ``superlinear``.
+    """
+    rows = {}
+    for name, group in report.groupby('function', sort=False):
+        if group['n_rows'].nunique() < 2:
+            continue
+        log_n = np.log(group['n_rows'].to_numpy(dtype=float))
+        time_exp = np.polyfit(log_n, np.log(group['seconds'].to_numpy(dtype=float)), 1)[0]
+        memory = group['peak_bytes'].to_numpy(dtype=float)
+        memory_exp = np.polyfit(log_n, np.log(memory), 1)[0] if np.all(memory > 0) else np.nan
+        rows[name] = {
+            'time_exponent': time_exp,
+            'memory_exponent': memory_exp,
+            'superlinear': time_exp > superlinear
+        }
+    return pd.DataFrame.from_dict(rows, orient='index')
+
+
+def plot_scaling(report, path=None):
+    """Plot time and peak memory against rows on log-log axes (requires matplotlib)."""
+    import matplotlib.pyplot as plt
+
+    fig, (ax_time, ax_mem) = plt.subplots(1, 2, figsize=(14, 6))
+    for name, group in report.groupby('function', sort=False):
+        ax_time.loglog(group['n_rows'], group['seconds'], marker='o', label=name)
+        ax_mem.loglog(group['n_rows'], group['peak_bytes'], marker='o', label=name)
+    ax_time.set(xlabel='rows', ylabel='seconds', title='Time')
+    ax_mem.set(xlabel='rows', ylabel='peak bytes', title='Peak memory')
+    ax_time.legend(fontsize='small')
+    fig.tight_layout()
+    if path is not None:
+        fig.savefig(path)
+    return fig
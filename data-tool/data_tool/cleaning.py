@@ -1,7 +1,15 @@
 import pandas as pd
 import numpy as np
+from scipy import sparse as sp
+from scipy.sparse.csgraph import connected_components
 
-def handle_missing_values(df, strategy='drop', columns=None, fill_value=None):
+from . import kernels
+from .indicators import FORMATS, MissingIndicators
+from .sampling import Sampler
+
+def handle_missing_values(df, strategy='drop', columns=None, fill_value=None, profile=None,
+                          approx=False, sample_size=10_000, random_state=0,
+                          indicators=None):
     """
     Handle missing values in a DataFrame.
     
@@ -16,12 +24,35 @@ def handle_missing_values(df, strategy='drop', columns=None, fill_value=None):
         Columns to process (default all columns)
     fill_value : scalar or dict, optional
         Value for 'constant' strategy (single value or {column: value})
+    profile : DataFrameProfile, optional
+        Precomputed statistics (see ``data_tool.profile``); used instead of
+        scanning the columns for means, medians and modes. Medians are
+        approximate (quantile sketch) once a column has more non-null
+        values than the profile's ``quantile_capacity`` (default 2048);
+        modes the profile cannot certify (more distinct values than
+        ``max_heavy_hitters`` and no clear leader) are computed from the
+        column instead
+    approx : bool, optional
+        Estimate means, medians and modes from a sample of ``sample_size``
+        rows per column; the estimates with their confidence intervals are
+        stored in ``result.attrs['approx_statistics']``
+    sample_size : int, optional
+        Rows sampled per column when ``approx`` is True
+    random_state : int, optional
+        Seed of the sample when ``approx`` is True
+    indicators : str, optional
+        'bitmask' or 'sparse' to also return which cells of the processed
+        columns were missing, as a ``MissingIndicators`` built from the
+        null masks the imputation computes (not available with 'drop')
         
     Returns:
     pandas.DataFrame
-        Processed DataFrame
+        Processed DataFrame, or a tuple (DataFrame, MissingIndicators)
+        when ``indicators`` is set
     """
     df_copy = df.copy()
+    sampler = Sampler(sample_size, random_state) if approx else None
+    masks = _indicator_masks(strategy, indicators)
 
     if columns is None:
         columns = df_copy.columns
@@ -37,9 +68,12 @@ def handle_missing_values(df, strategy='drop', columns=None, fill_value=None):
                 df_copy, 
                 col, 
                 col_strategy, 
-                col_fill_value
+                col_fill_value,
+                profile,
+                sampler,
+                masks
             )
-        return df_copy
+        return _with_indicators(_with_approx_statistics(df_copy, sampler), masks, indicators)
     
     if strategy == 'drop':
         return df_copy.dropna(subset=columns)
@@ -49,43 +83,134 @@ def handle_missing_values(df, strategy='drop', columns=None, fill_value=None):
             df_copy, 
             col, 
             strategy, 
-            fill_value
+            fill_value,
+            profile,
+            sampler,
+            masks
         )
     
-    return df_copy
+    return _with_indicators(_with_approx_statistics(df_copy, sampler), masks, indicators)
+
+def _indicator_masks(strategy, indicators):
+    if indicators is None:
+        return None
+    if indicators not in FORMATS:
+        raise ValueError(f"indicators must be one of {FORMATS}, got {indicators!r}")
+    strategies = strategy.values() if isinstance(strategy, dict) else [strategy]
+    if 'drop' in strategies:
+        raise ValueError("Missing-value indicators cannot be combined with the 'drop' strategy")
+    return {}
+
+def _with_indicators(df, masks, indicators):
+    if masks is None:
+        return df
+    return df, MissingIndicators(df.index, masks, indicators)
+
+def _with_approx_statistics(df, sampler):
+    if sampler is not None:
+        df.attrs['approx_statistics'] = sampler.statistics
+    return df
 
-def _apply_missing_value_strategy(df, col, strategy, fill_value=None):
+def _apply_missing_value_strategy(df, col, strategy, fill_value=None, profile=None, sampler=None,
+                                  masks=None):
     """Вспомогательная функция для обработки пропусков в одном столбце"""
     if strategy == 'drop':
         return df.dropna(subset=[col])
     
-    if pd.api.types.is_numeric_dtype(df[col]):
+    missing = df[col].isna().to_numpy()
+    if masks is not None:
+        masks[col] = missing
+
+    fill_val = _fill_value(df[col], strategy, fill_value, profile, sampler)
+    if fill_val is None or not missing.any():
+        return df
+    df[col] = df[col].mask(missing, fill_val)
+    return df
+
+def _fill_value(series, strategy, fill_value=None, profile=None, sampler=None):
+    col = series.name
+    stats = profile.get(col) if profile is not None else None
+    if pd.api.types.is_numeric_dtype(series):
         if strategy == 'mean':
-            fill_val = df[col].mean()
+            return _mean(series, stats, sampler)
         elif strategy == 'median':
-            fill_val = df[col].median()
+            return _median(series, stats, sampler)
         elif strategy == 'mode':
-            mode_vals = df[col].mode()
-            fill_val = mode_vals[0] if not mode_vals.empty else None
+            return _mode(series, stats, sampler)
         elif strategy == 'constant':
-            fill_val = fill_value
+            return fill_value
         else:
             raise ValueError(f"Unknown strategy: {strategy} for column {col}")
     else:  
         if strategy == 'mode':
-            mode_vals = df[col].mode()
-            fill_val = mode_vals[0] if not mode_vals.empty else None
+            return _mode(series, stats, sampler)
         elif strategy == 'constant':
-            fill_val = fill_value
+            return fill_value
         else:
             raise ValueError(f"Strategy {strategy} not supported for non-numeric column {col}")
 
-    if fill_val is None:
-        return df
-    df[col] = df[col].fillna(fill_val)
-    return df
+def missing_value_fills(df, strategy, columns=None, fill_value=None, profile=None,
+                        approx=False, sample_size=10_000, random_state=0):
+    """
+    Resolve the arguments of handle_missing_values to constant fills.
 
-def remove_duplicates(df, subset=None, keep='first'):
+    Computes the value every imputed column would be filled with, so
+    that row chunks of ``df`` can be imputed identically with
+    ``handle_missing_values(chunk, strategy, fill_value=fills)``.
+
+    Parameters:
+    df : pandas.DataFrame
+        Input DataFrame
+    strategy, columns, fill_value, profile, approx, sample_size, random_state
+        As for handle_missing_values
+
+    Returns:
+    tuple
+        (strategy, fill_value): 'drop' entries are kept, every other
+        strategy becomes 'constant' with its value in the fill_value dict
+    """
+    if not isinstance(strategy, dict):
+        if strategy == 'drop':
+            return strategy, fill_value
+        strategy = {col: strategy for col in (df.columns if columns is None else columns)}
+    sampler = Sampler(sample_size, random_state) if approx else None
+
+    strategies, fills = {}, {}
+    for col, col_strategy in strategy.items():
+        if col not in df.columns:
+            continue
+        if col_strategy == 'drop':
+            strategies[col] = col_strategy
+            continue
+        col_fill_value = fill_value.get(col) if isinstance(fill_value, dict) else fill_value
+        strategies[col] = 'constant'
+        fills[col] = _fill_value(df[col], col_strategy, col_fill_value, profile, sampler)
+    return strategies, fills
+
+def _mean(series, stats=None, sampler=None):
+    if stats is not None:
+        return stats.mean
+    if sampler is not None:
+        return sampler.mean(series).value
+    return series.mean()
+
+def _median(series, stats=None, sampler=None):
+    if stats is not None:
+        return stats.median()
+    if sampler is not None:
+        return sampler.median(series).value
+    return kernels.median(series)
+
+def _mode(series, stats=None, sampler=None):
+    # past its capacity the heavy-hitter summary may not hold the mode
+    if stats is not None and stats.mode_is_exact:
+        return stats.mode()
+    if sampler is not None:
+        return sampler.mode(series).value
+    return kernels.mode(series)
+
+def remove_duplicates(df, subset=None, keep='first', method='exact', threshold=0.8,
+                      num_perm=128, shingle_size=3, seed=0):
     """
     Remove duplicate rows from DataFrame.
     
@@ -96,36 +221,320 @@ def remove_duplicates(df, subset=None, keep='first'):
         Columns to consider (default all columns)
     keep : {'first', 'last', False}, optional
         Which duplicates to keep
+    method : {'exact', 'minhash'}, optional
+        'exact' drops identical rows; 'minhash' drops near-duplicates
+        found with MinHash signatures and LSH banding (see
+        ``near_duplicate_groups``)
+    threshold : float, optional
+        Minimum estimated Jaccard similarity of the shingle sets (for 'minhash')
+    num_perm : int, optional
+        Number of MinHash permutations (for 'minhash')
+    shingle_size : int, optional
+        Character n-gram length (for 'minhash')
+    seed : int, optional
+        Seed for the MinHash permutations (for 'minhash')
         
     Returns:
     pandas.DataFrame
         DataFrame without duplicates
     """
-    return df.drop_duplicates(subset=subset, keep=keep)
+    if method == 'exact':
+        return df.drop_duplicates(subset=subset, keep=keep)
+    if method != 'minhash':
+        raise ValueError(f"Unknown method: {method}")
+
+    groups = near_duplicate_groups(df, subset, threshold, num_perm, shingle_size, seed)
+    return df[~groups.duplicated(keep=keep).to_numpy()]
+
+def near_duplicate_groups(df, subset=None, threshold=0.8, num_perm=128,
+                          shingle_size=3, seed=0):
+    """
+    Label groups of near-duplicate rows in roughly linear time.
+    
+    The chosen columns are normalized (lowercase, collapsed whitespace),
+    joined and split into character shingles. MinHash signatures are
+    computed for all rows at once, LSH banding puts similar signatures in
+    the same bucket, and only pairs sharing a bucket are compared. Pairs
+    whose estimated Jaccard similarity reaches ``threshold`` are linked,
+    and groups are the connected components of those links.
+    
+    Parameters:
+    df : pandas.DataFrame
+        Input DataFrame
+    subset : list, optional
+        Columns to compare (default all columns)
+    threshold : float, optional
+        Minimum estimated Jaccard similarity
+    num_perm : int, optional
+        Number of MinHash permutations
+    shingle_size : int, optional
+        Character n-gram length
+    seed : int, optional
+        Seed for the MinHash permutations
+        
+    Returns:
+    pandas.Series
+        Group label per row (aligned with ``df.index``); rows with the
+        same label are near-duplicates of each other
+    """
+    if not 0 < threshold <= 1:
+        raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+    n = len(df)
+    if n == 0:
+        return pd.Series(np.empty(0, dtype=np.int64), index=df.index)
+
+    text = _normalized_text(df, subset)
+    signatures = _minhash_signatures(text, num_perm, shingle_size, seed)
+
+    bands, rows = _lsh_parameters(threshold, num_perm)
+    left, right = [], []
+    for band in range(bands):
+        keys = pd.util.hash_pandas_object(
+            pd.DataFrame(signatures[:, band * rows:(band + 1) * rows]), index=False
+        ).to_numpy()
+        order = np.lexsort((np.arange(n), keys))
+        sorted_keys = keys[order]
+        same = np.r_[False, sorted_keys[1:] == sorted_keys[:-1]]
+        # Link every bucket member to its predecessor and to the bucket leader.
+        starts = np.maximum.accumulate(np.where(same, 0, np.arange(n)))
+        members = order[same]
+        left += [order[np.flatnonzero(same) - 1], order[starts[same]]]
+        right += [members, members]
+
+    left = np.concatenate(left) if left else np.empty(0, dtype=np.intp)
+    right = np.concatenate(right) if right else np.empty(0, dtype=np.intp)
+    pairs = np.unique(np.minimum(left, right) * n + np.maximum(left, right))
+    left, right = pairs // n, pairs % n
+    left, right = left[left != right], right[left != right]
+
+    similar = np.empty(left.size, dtype=bool)
+    for start in range(0, left.size, 65536):
+        stop = start + 65536
+        agreement = signatures[left[start:stop]] == signatures[right[start:stop]]
+        similar[start:stop] = agreement.mean(axis=1) >= threshold
+
+    graph = sp.coo_matrix(
+        (np.ones(int(similar.sum()), dtype=np.int8), (left[similar], right[similar])),
+        shape=(n, n)
+    )
+    _, labels = connected_components(graph, directed=False)
+    return pd.Series(labels, index=df.index)
+
+def _normalized_text(df, subset):
+    columns = list(df.columns if subset is None else subset)
+    parts = [
+        df[col].astype(str).where(df[col].notna(), '')
+        .str.lower().str.replace(r'\s+', ' ', regex=True).str.strip()
+        for col in columns
+    ]
+    text = parts[0]
+    for part in parts[1:]:
+        text = text + '\x1f' + part
+    return text.to_numpy(dtype=object)
+
+def _mix64(x):
+    """SplitMix64 finalizer: spreads polynomial shingle hashes over all 64 bits."""
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+def _shingle_hashes(text, k):
+    """
+    Hash all character k-grams of a block of strings without Python loops.
+    
+    Returns (row, hash) arrays sorted by row. Strings shorter than ``k``
+    contribute themselves as a single shingle.
+    """
+    lengths = np.fromiter((len(t) for t in text), dtype=np.int64, count=len(text))
+    codes = np.frombuffer('\x00'.join(text).encode('utf-32-le'), dtype=np.uint32)
+    codes = codes.astype(np.uint64) + np.uint64(1)
+    starts = np.r_[0, np.cumsum(lengths + 1)[:-1]]
+
+    windows = max(codes.size - k + 1, 0)
+    hashes = np.zeros(windows, dtype=np.uint64)
+    for j in range(k):
+        hashes = hashes * np.uint64(0x100000001B3) + codes[j:j + windows]
+    positions = np.arange(windows)
+    row = np.repeat(np.arange(len(text)), lengths + 1)[:windows]
+    valid = positions + k <= (starts + lengths)[row]
+    rows, hashes = row[valid], hashes[valid]
+
+    short = np.flatnonzero((lengths > 0) & (lengths < k))
+    if short.size:
+        short_hashes = pd.util.hash_array(np.asarray(text[short], dtype=object), categorize=False)
+        rows = np.concatenate([rows, short])
+        hashes = np.concatenate([hashes, short_hashes])
+        order = np.argsort(rows, kind='stable')
+        rows, hashes = rows[order], hashes[order]
+    return rows, _mix64(hashes)
+
+def _minhash_signatures(text, num_perm, k, seed, block_rows=20000):
+    """MinHash signatures (n_rows, num_perm) from multiply-shift hash permutations."""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+    empty = np.uint64(np.iinfo(np.uint32).max)
+    signatures = np.full((len(text), num_perm), empty, dtype=np.uint64)
+
+    for start in range(0, len(text), block_rows):
+        rows, hashes = _shingle_hashes(text[start:start + block_rows], k)
+        if rows.size == 0:
+            continue
+        segment_starts = np.r_[0, np.flatnonzero(np.diff(rows)) + 1]
+        present = start + rows[segment_starts]
+        step = max(1, (1 << 22) // hashes.size)
+        for p in range(0, num_perm, step):
+            permuted = (a[p:p + step, None] * hashes[None, :] + b[p:p + step, None]) >> np.uint64(32)
+            signatures[present, p:p + step] = np.minimum.reduceat(permuted, segment_starts, axis=1).T
+    return signatures
+
+def _lsh_parameters(threshold, num_perm):
+    """Pick (bands, rows) whose S-curve midpoint (1/b)^(1/r) is closest to threshold."""
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
 
 def clip_outliers(df, column, method='iqr', threshold=1.5, 
-                 lower_quantile=0.05, upper_quantile=0.95):
+                 lower_quantile=0.05, upper_quantile=0.95, profile=None,
+                 approx=False, sample_size=10_000, random_state=0):
+    """
+    Clip outliers in one or more numeric columns.
+    
+    The data is copied once. Per column, the needed quantiles and the
+    min/max used to detect constant columns come from one selection with
+    the dtype-specialized kernels in ``data_tool.kernels``; the numeric
+    columns are then clipped at once as a block with per-column bounds.
+    
+    Parameters:
+    df : pandas.DataFrame
+        Input DataFrame
+    column : str, list or dict
+        Column name, list of column names, or {column: method} /
+        {column: {'method': ..., 'threshold': ..., 'lower_quantile': ...,
+        'upper_quantile': ...}} for per-column settings (missing keys
+        fall back to the arguments below)
+    method : {'iqr', 'quantile'}, optional
+        Outlier detection method
+    threshold : float, optional
+        IQR multiplier (for 'iqr' method)
+    lower_quantile : float, optional
+        Lower quantile (for 'quantile' method)
+    upper_quantile : float, optional
+        Upper quantile (for 'quantile' method)
+    profile : DataFrameProfile, optional
+        Precomputed statistics; quantiles and the constant-column check
+        are taken from it instead of scanning the column. Quantiles are
+        approximate (quantile sketch) once a column has more non-null
+        values than the profile's ``quantile_capacity`` (default 2048)
+    approx : bool, optional
+        Estimate the quantiles of numeric columns from a sample of
+        ``sample_size`` rows per column; the estimates with their confidence intervals are stored
+        in ``result.attrs['approx_statistics']``
+    sample_size : int, optional
+        Rows sampled per column when ``approx`` is True
+    random_state : int, optional
+        Seed of the sample when ``approx`` is True
+        
+    Returns:
+    pandas.DataFrame
+        DataFrame with clipped values
+    """
+    defaults = {
+        'method': method,
+        'threshold': threshold,
+        'lower_quantile': lower_quantile,
+        'upper_quantile': upper_quantile
+    }
+    specs = _clip_specs(column, defaults)
     df_copy = df.copy()
-    series = df_copy[column]
+    sampler = Sampler(sample_size, random_state) if approx else None
     
-    if series.empty:
-        return df_copy
+    if df_copy.empty or not specs:
+        return _with_approx_statistics(df_copy, sampler)
 
-    if series.nunique() == 1:
-        return df_copy
+    columns = list(specs)
+    probs = sorted({q for spec in specs.values() for q in _clip_quantiles(spec)})
+    # non-numeric profiles (e.g. datetimes) carry no quantile sketch
+    profiled = [col for col in columns
+                if profile is not None and col in profile and profile[col].numeric]
+    # the sampler estimates float quantiles; other columns are scanned
+    sampled = [col for col in columns
+               if sampler is not None and col not in profiled
+               and pd.api.types.is_numeric_dtype(df_copy[col])]
+    scanned = [col for col in columns
+               if col not in profiled and col not in sampled]
+
+    quantiles = {}
+    constant = {}
+    for col in sampled:
+        # no constant check: a mostly-constant column with rare outliers
+        # can look constant in the sample; collapsed bounds still clip it
+        constant[col] = False
+        stats = sampler.quantiles(df_copy[col], probs)
+        quantiles[col] = {q: stat.value for q, stat in zip(probs, stats)}
+    for col in scanned:
+        # min and max ride along with the clip quantiles in one selection
+        low, high, *values = kernels.quantiles(df_copy[col], [0.0, 1.0] + probs)
+        constant[col] = low == high
+        quantiles[col] = dict(zip(probs, values))
+    for col in profiled:
+        if col not in quantiles:
+            stats = profile[col]
+            constant[col] = stats.is_constant
+            quantiles[col] = dict(zip(probs, np.atleast_1d(stats.quantile(probs))))
+
+    # bounds stay in each column's own type (floats, Timestamps, ...)
+    bounds = {}
+    for col, spec in specs.items():
+        if constant[col]:
+            continue
+        q = quantiles[col]
+        if spec['method'] == 'iqr':
+            iqr = q[0.75] - q[0.25]
+            bounds[col] = (q[0.25] - spec['threshold'] * iqr, q[0.75] + spec['threshold'] * iqr)
+        else:
+            bounds[col] = (q[spec['lower_quantile']], q[spec['upper_quantile']])
     
-    if method == 'iqr':
-        q1 = series.quantile(0.25)
-        q3 = series.quantile(0.75)
-        iqr = q3 - q1
-        lower_bound = q1 - threshold * iqr
-        upper_bound = q3 + threshold * iqr
-    elif method == 'quantile':
-        lower_bound = series.quantile(lower_quantile)
-        upper_bound = series.quantile(upper_quantile)
+    numeric = [col for col in columns if pd.api.types.is_numeric_dtype(df_copy[col])]
+    if numeric:
+        no_bounds = (np.nan, np.nan)
+        lower = pd.Series([bounds.get(col, no_bounds)[0] for col in numeric], index=numeric, dtype=np.float64)
+        upper = pd.Series([bounds.get(col, no_bounds)[1] for col in numeric], index=numeric, dtype=np.float64)
+        block = df_copy[numeric]
+        clipped = block.clip(lower, upper, axis=1)
+        df_copy[numeric] = clipped.astype(block.dtypes.to_dict())
+    for col in columns:
+        if col not in numeric and col in bounds:
+            series = df_copy[col]
+            df_copy[col] = series.clip(*bounds[col]).astype(series.dtype)
+    return _with_approx_statistics(df_copy, sampler)
+
+def _clip_specs(column, defaults):
+    """Normalize the ``column`` argument of clip_outliers to {column: settings}."""
+    if isinstance(column, dict):
+        items = column.items()
+    elif isinstance(column, (list, tuple, pd.Index)):
+        items = ((col, {}) for col in column)
     else:
-        raise ValueError(f"Unknown method: {method}")
-    
-    clipped = series.clip(lower_bound, upper_bound)
-    df_copy[column] = clipped.astype(series.dtype, copy=False)
-    return df_copy
+        items = [(column, {})]
+
+    specs = {}
+    for col, settings in items:
+        if isinstance(settings, str):
+            settings = {'method': settings}
+        spec = {**defaults, **settings}
+        if spec['method'] not in ('iqr', 'quantile'):
+            raise ValueError(f"Unknown method: {spec['method']}")
+        specs[col] = spec
+    return specs
+
+def _clip_quantiles(spec):
+    if spec['method'] == 'iqr':
+        return (0.25, 0.75)
+    return (spec['lower_quantile'], spec['upper_quantile'])
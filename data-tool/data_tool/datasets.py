@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+
+def make_dataset(n_rows, n_numeric=5, n_categorical=3, missing_rate=0.05,
+                 outlier_rate=0.01, duplicate_rate=0.02, cardinality=50,
+                 skew=1.2, seed=0):
+    """
+    Generate a synthetic DataFrame with controlled data quality problems.
+
+    Parameters:
+    n_rows : int
+        Number of rows
+    n_numeric : int, optional
+        Number of float columns ``num_0 ... num_{n-1}``
+    n_categorical : int, optional
+        Number of string columns ``cat_0 ... cat_{n-1}``
+    missing_rate : float, optional
+        Fraction of cells set to missing in every column
+    outlier_rate : float, optional
+        Fraction of numeric cells replaced by extreme values
+    duplicate_rate : float, optional
+        Fraction of rows that are exact copies of earlier rows
+    cardinality : int, optional
+        Number of distinct categories per categorical column
+    skew : float, optional
+        Zipf exponent of the category frequencies (0 gives uniform)
+    seed : int, optional
+        Random seed
+
+    Returns:
+    pandas.DataFrame
+        Generated DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    n_unique = max(1, n_rows - int(n_rows * duplicate_rate))
+    data = {}
+
+    for i in range(n_numeric):
+        values = rng.normal(loc=100 * i, scale=10 * (i + 1), size=n_unique)
+        outliers = rng.random(n_unique) < outlier_rate
+        values[outliers] = values[outliers] * 100 + rng.choice([-1, 1], outliers.sum()) * 1e4
+        data[f'num_{i}'] = values
+
+    weights = 1.0 / np.arange(1, cardinality + 1) ** skew
+    weights /= weights.sum()
+    for i in range(n_categorical):
+        labels = np.array([f'c{i}_{j}' for j in range(cardinality)], dtype=object)
+        data[f'cat_{i}'] = labels[rng.choice(cardinality, size=n_unique, p=weights)]
+
+    df = pd.DataFrame(data)
+    if missing_rate > 0:
+        for col in df.columns:
+            df.loc[rng.random(n_unique) < missing_rate, col] = np.nan
+
+    if n_rows > n_unique:
+        copies = df.iloc[rng.integers(0, n_unique, size=n_rows - n_unique)]
+        order = rng.permutation(n_rows)
+        df = pd.concat([df, copies], ignore_index=True).iloc[order].reset_index(drop=True)
+    return df
+
+
+def write_dataset(path, n_rows, chunksize=1_000_000, **kwargs):
+    """
+    Generate a dataset of ``n_rows`` rows straight to a Parquet file.
+
+    Rows are generated and written in chunks, so files larger than memory
+    can be produced. Requires pyarrow. Keyword arguments go to
+    ``make_dataset``; each chunk uses ``seed + chunk number``.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    seed = kwargs.pop('seed', 0)
+    writer = None
+    try:
+        for number, start in enumerate(range(0, n_rows, chunksize)):
+            chunk = make_dataset(min(chunksize, n_rows - start), seed=seed + number, **kwargs)
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
@@ -0,0 +1,144 @@
+"""
+Partition-parallel execution of data_tool transforms on Dask DataFrames.
+
+Global statistics are computed with a tree reduction of per-partition
+profiles; each transform then runs per partition via ``map_partitions``
+with that shared profile, so every partition sees the same means, clip
+bounds and category sets and produces the same output columns.
+"""
+
+from .cleaning import handle_missing_values, remove_duplicates
+from .fused import fused_numeric_transform
+from .profiling import profile
+from .steps import NEEDS_PROFILE, check_categories, check_quantiles, step_columns
+
+
+def _require_dask():
+    try:
+        import dask
+    except ImportError as e:
+        raise ImportError(
+            "Dask support requires dask[dataframe]: pip install 'data-tool[dask]'"
+        ) from e
+    return dask
+
+
+def _merge_profiles(left, right):
+    return left.merge(right)
+
+
+def profile_dask(ddf, columns=None, split_every=8, **options):
+    """
+    Profile a Dask DataFrame with a tree reduction over its partitions.
+
+    Parameters:
+    ddf : dask.dataframe.DataFrame
+        Input collection
+    columns : list, optional
+        Columns to profile (default all columns)
+    split_every : int, optional
+        Fan-in of the merge tree
+    **options
+        Sketch sizes passed to ``data_tool.profile``
+
+    Returns:
+    DataFrameProfile
+        Profile of the whole collection
+    """
+    dask = _require_dask()
+    profiles = [
+        dask.delayed(profile)(part, columns=columns, **options)
+        for part in ddf.to_delayed()
+    ]
+    if not profiles:
+        return profile(ddf._meta, columns=columns, **options)
+    while len(profiles) > 1:
+        merged = []
+        for start in range(0, len(profiles), split_every):
+            group = profiles[start:start + split_every]
+            node = group[0]
+            for other in group[1:]:
+                node = dask.delayed(_merge_profiles)(node, other)
+            merged.append(node)
+        profiles = merged
+    return profiles[0].compute()
+
+
+def _check_modes(profile, kwargs):
+    """Raise ValueError if a 'mode' fill is not pinned down by ``profile``."""
+    strategy = kwargs.get('strategy', 'drop')
+    if isinstance(strategy, dict):
+        columns = [col for col, col_strategy in strategy.items() if col_strategy == 'mode']
+    elif strategy == 'mode':
+        columns = kwargs.get('columns') or list(profile)
+    else:
+        columns = []
+    for col in columns:
+        if col in profile and not profile[col].mode_is_exact:
+            # each partition would fall back to its own mode
+            raise ValueError(
+                f"The profile cannot determine the mode of column {col}; "
+                f"profile with a larger max_heavy_hitters"
+            )
+
+
+def apply_dask(ddf, func, profile=None, **kwargs):
+    """
+    Apply a data_tool transform to every partition of a Dask DataFrame.
+
+    Transforms that need global statistics get a profile computed with
+    ``profile_dask`` (unless one is passed). Output metadata is derived by
+    running the transform on the empty meta frame with the same profile,
+    so ``one_hot_encode`` yields identical columns in every partition.
+    Options that would return something other than a frame per partition
+    (``indicators=``) are rejected, as are 'mode' fills and clipped
+    columns the profile cannot pin down.
+
+    Parameters:
+    ddf : dask.dataframe.DataFrame
+        Input collection
+    func : callable
+        data_tool function to apply
+    profile : DataFrameProfile, optional
+        Precomputed global statistics
+    **kwargs
+        Arguments for ``func``
+
+    Returns:
+    dask.dataframe.DataFrame
+        Lazily transformed collection
+    """
+    _require_dask()
+    if func is remove_duplicates:
+        if kwargs.get('method', 'exact') != 'exact':
+            raise NotImplementedError("Near-duplicate removal is not available for Dask DataFrames")
+        if kwargs.get('keep', 'first') is False:
+            raise NotImplementedError(
+                "keep=False is not supported for Dask DataFrames; use keep='first' or 'last'"
+            )
+        return ddf.drop_duplicates(subset=kwargs.get('subset'), keep=kwargs.get('keep', 'first'))
+    if func is handle_missing_values and kwargs.get('indicators') is not None:
+        raise NotImplementedError(
+            "indicators are not supported for Dask DataFrames; use ddf.isna() for the missing-value masks"
+        )
+    if func is fused_numeric_transform:
+        raise NotImplementedError(
+            "fused_numeric_transform needs exact order statistics; "
+            "use handle_missing_values, clip_outliers and a scaler with a profile instead"
+        )
+
+    needs_profile = func in NEEDS_PROFILE
+    if func is handle_missing_values and kwargs.get('strategy', 'drop') == 'drop':
+        needs_profile = False
+    if needs_profile:
+        if profile is None:
+            profile = profile_dask(ddf, columns=step_columns(func, ddf._meta, kwargs))
+        check_categories(func, profile, kwargs)
+        check_quantiles(func, profile, kwargs)
+        if func is handle_missing_values:
+            _check_modes(profile, kwargs)
+        kwargs['profile'] = profile
+
+    meta = func(ddf._meta, **kwargs)
+    return ddf.map_partitions(func, meta=meta, **kwargs)
+
@@ -1,25 +1,62 @@
+import numpy as np
 import pandas as pd
+from scipy import sparse as sp
 from sklearn.preprocessing import LabelEncoder
 
+from .sketches import HeavyHitters
 
-def one_hot_encode(df, columns, drop_first=False):
+OTHER_CATEGORY = '__other__'
+
+
+def one_hot_encode(df, columns, drop_first=False, profile=None,
+                   max_categories=None, min_frequency=None):
     """
     Perform one-hot encoding on categorical columns.
     
     Parameters:
-    ... (existing docstring)
+    df : pandas.DataFrame
+        Input DataFrame
+    columns : list
+        Columns to encode
+    drop_first : bool, optional
+        Whether to drop first category
+    profile : DataFrameProfile, optional
+        Precomputed statistics; the category set is taken from it, so
+        every chunk encoded with the same profile gets the same columns
+    max_categories : int, optional
+        Keep only the most frequent categories; the rest go to the
+        ``{col}___other__`` column
+    min_frequency : int or float, optional
+        Minimum count (int) or fraction of non-null rows (float) for a
+        category to get its own column; rarer values go to ``__other__``
+        
+    Returns:
+    pandas.DataFrame
+        Encoded DataFrame
     """
     df_copy = df.copy()
     
     for col in columns:
-        categories = sorted(df_copy[col].unique())
+        values = df_copy[col]
+        if max_categories is not None or min_frequency is not None:
+            categories = _frequent_categories(
+                values, profile.get(col) if profile is not None else None,
+                max_categories, min_frequency
+            )
+        else:
+            categories = _profile_categories(profile, col)
+        if categories is not None:
+            values = _as_categorical(values, categories)
 
         dummies = pd.get_dummies(
-            df_copy[col], 
+            values, 
             prefix=col, 
             drop_first=drop_first,
             dtype=int
         )
+        if max_categories is not None or min_frequency is not None:
+            other = df_copy[col].notna() & values.isna()
+            dummies[f"{col}_{OTHER_CATEGORY}"] = other.astype(int)
 
         df_copy = df_copy.drop(col, axis=1)
         
@@ -28,7 +65,7 @@ def one_hot_encode(df, columns, drop_first=False):
     return df_copy
 
 
-def label_encode(df, columns):
+def label_encode(df, columns, profile=None):
     """
     Perform label encoding on categorical columns.
     
@@ -37,6 +74,9 @@ def label_encode(df, columns):
         Input DataFrame
     columns : list
         Columns to encode
+    profile : DataFrameProfile, optional
+        Precomputed statistics; labels are assigned from its sorted
+        category set instead of fitting on the column
         
     Returns:
     pandas.DataFrame
@@ -46,6 +86,122 @@ def label_encode(df, columns):
     le = LabelEncoder()
     
     for col in columns:
-        df_copy[col] = le.fit_transform(df_copy[col])
+        categories = _profile_categories(profile, col)
+        if categories is None:
+            df_copy[col] = le.fit_transform(df_copy[col])
+            continue
+
+        codes = _as_categorical(df_copy[col], categories).cat.codes
+        if (codes < 0).any():
+            raise ValueError(f"Column {col} contains labels not present in the profile")
+        df_copy[col] = codes.astype('int64')
     
     return df_copy
+
+
+def hash_encode(df, columns, n_features=256, signed=True, sparse=False):
+    """
+    Encode categorical columns with the hashing trick.
+    
+    Each value is hashed into one of ``n_features`` buckets, so memory is
+    bounded regardless of cardinality and no fitted state is needed.
+    Missing values encode to an all-zero row.
+    
+    Parameters:
+    df : pandas.DataFrame
+        Input DataFrame
+    columns : list
+        Columns to encode
+    n_features : int, optional
+        Number of buckets (output columns) per encoded column
+    signed : bool, optional
+        Use a second hash bit to emit +1/-1 so that collisions tend to
+        cancel out instead of accumulating
+    sparse : bool, optional
+        Return sparse columns instead of dense int8 columns
+        
+    Returns:
+    pandas.DataFrame
+        Encoded DataFrame with columns ``{col}_hash_{i}``
+    """
+    if n_features < 1:
+        raise ValueError(f"n_features must be positive, got {n_features}")
+
+    df_copy = df.copy()
+    
+    for col in columns:
+        block = _hash_block(df_copy[col], n_features, signed, sparse)
+        df_copy = df_copy.drop(col, axis=1)
+        df_copy = pd.concat([df_copy, block], axis=1)
+    
+    return df_copy
+
+
+def _hash_block(series, n_features, signed, sparse):
+    """Hash one column into an (n_rows, n_features) block."""
+    present = series.notna().to_numpy()
+    rows = np.flatnonzero(present)
+    hashes = pd.util.hash_array(series.to_numpy()[present], categorize=False)
+    buckets = (hashes % np.uint64(n_features)).astype(np.intp)
+    if signed:
+        values = np.where(hashes >> np.uint64(63), -1, 1).astype(np.int8)
+    else:
+        values = np.ones(rows.size, dtype=np.int8)
+
+    names = [f"{series.name}_hash_{i}" for i in range(n_features)]
+    if sparse:
+        matrix = sp.csr_matrix((values, (rows, buckets)), shape=(len(series), n_features))
+        return pd.DataFrame.sparse.from_spmatrix(matrix, index=series.index, columns=names)
+
+    block = np.zeros((len(series), n_features), dtype=np.int8)
+    block[rows, buckets] = values
+    return pd.DataFrame(block, index=series.index, columns=names)
+
+
+def _frequent_categories(series, stats, max_categories, min_frequency, chunksize=65536):
+    """
+    Find the categories that get their own one-hot column.
+    
+    Frequencies come from a Misra-Gries heavy-hitter sketch (the profile's
+    if given, else one streamed over the column in chunks), so memory is
+    bounded by the sketch capacity rather than the column cardinality.
+    """
+    if stats is not None:
+        heavy = stats.heavy_hitters
+    else:
+        capacity = 1024
+        if max_categories is not None:
+            capacity = max(capacity, 2 * max_categories)
+        if isinstance(min_frequency, float):
+            capacity = max(capacity, int(np.ceil(1 / min_frequency)))
+        heavy = HeavyHitters(capacity)
+        for start in range(0, len(series), chunksize):
+            heavy.update(series.iloc[start:start + chunksize])
+
+    counts = heavy.most_common()
+    if min_frequency is not None:
+        if isinstance(min_frequency, float):
+            min_frequency = min_frequency * heavy.total
+        counts = counts[counts >= min_frequency]
+    if max_categories is not None:
+        counts = counts.iloc[:max_categories]
+
+    categories = list(counts.index)
+    try:
+        return sorted(categories)
+    except TypeError:
+        return categories
+
+
+def _as_categorical(series, categories):
+    """Cast to a fixed category set; values outside it become missing."""
+    codes = pd.Index(categories).get_indexer(series)
+    values = pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(categories))
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def _profile_categories(profile, col):
+    """Sorted categories of a column from a profile, or None if unavailable."""
+    if profile is None or col not in profile:
+        return None
+    return profile[col].categories
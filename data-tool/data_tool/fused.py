@@ -0,0 +1,259 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def fused_numeric_transform(df, columns, impute=None, fill_value=None,
+                            clip=None, threshold=1.5, lower_quantile=0.05,
+                            upper_quantile=0.95, scale=None, out=None,
+                            engine='auto'):
+    """
+    Impute, clip and scale numeric columns in a single pass over the data.
+
+    Gives the same result as chaining ``handle_missing_values``,
+    ``clip_outliers`` and one of the scalers, but computes all parameters
+    from per-column reductions first and then applies them in one fused
+    kernel that reads the input block once and writes the output once.
+
+    Parameters:
+    df : pandas.DataFrame
+        Input DataFrame
+    columns : list
+        Numeric columns to transform
+    impute : {'mean', 'median', 'mode', 'constant'}, optional
+        Missing value strategy (default: leave missing values)
+    fill_value : scalar, optional
+        Value for 'constant' imputation
+    clip : {'iqr', 'quantile'}, optional
+        Outlier clipping method (default: no clipping)
+    threshold : float, optional
+        IQR multiplier (for 'iqr' clipping)
+    lower_quantile, upper_quantile : float, optional
+        Quantiles (for 'quantile' clipping)
+    scale : {'minmax', 'standard', 'robust'}, optional
+        Scaling method (default: no scaling)
+    out : numpy.ndarray, optional
+        Preallocated float64 array of shape (len(df), len(columns)) that
+        receives the transformed block
+    engine : {'auto', 'numpy', 'numba'}, optional
+        Kernel implementation; 'auto' uses Numba when it is installed
+
+    Returns:
+    pandas.DataFrame
+        Transformed DataFrame
+    """
+    columns = list(columns)
+    block = df[columns].to_numpy(dtype=np.float64)
+    if out is None:
+        out = np.empty(block.shape, dtype=np.float64, order='F')
+    elif out.shape != block.shape or out.dtype != np.float64:
+        raise ValueError(f"out must be a float64 array of shape {block.shape}")
+
+    params = np.array([
+        _column_parameters(
+            block[:, j], impute, fill_value, clip, threshold,
+            lower_quantile, upper_quantile, scale
+        )
+        for j in range(block.shape[1])
+    ], dtype=np.float64).reshape(-1, 5).T
+    fill, lower, upper, center, divisor = (np.ascontiguousarray(p) for p in params)
+
+    if engine == 'auto':
+        engine = 'numba' if numba is not None else 'numpy'
+    if engine == 'numba':
+        if numba is None:
+            raise ImportError("engine='numba' requires the numba package")
+        _numba_kernel()(block, fill, lower, upper, center, divisor, out)
+    elif engine == 'numpy':
+        _numpy_kernel(block, fill, lower, upper, center, divisor, out)
+    else:
+        raise ValueError(f"Unknown engine: {engine}")
+
+    df_copy = df.copy()
+    df_copy[columns] = out
+    if scale is None:
+        for col in columns:
+            if pd.api.types.is_integer_dtype(df[col].dtype):
+                df_copy[col] = df_copy[col].astype(df[col].dtype)
+    return df_copy
+
+
+def _column_parameters(x, impute, fill_value, clip, threshold,
+                       lower_quantile, upper_quantile, scale):
+    """
+    Compute (fill, lower, upper, center, divisor) for one column.
+
+    Clip bounds are quantiles of the imputed column and scaling statistics
+    are taken from the clipped column, exactly as in the chained calls, but
+    without materializing either intermediate column: the imputed column
+    is the non-null values plus ``missing`` copies of the fill value.
+    """
+    values = x[~np.isnan(x)]
+    missing = x.size - values.size
+
+    if impute is None:
+        fill = np.nan
+    elif impute == 'mean':
+        fill = values.mean() if values.size else np.nan
+    elif impute == 'median':
+        fill = np.median(values) if values.size else np.nan
+    elif impute == 'mode':
+        if values.size:
+            uniques, counts = np.unique(values, return_counts=True)
+            fill = uniques[np.argmax(counts)]
+        else:
+            fill = np.nan
+    elif impute == 'constant':
+        fill = np.nan if fill_value is None else float(fill_value)
+    else:
+        raise ValueError(f"Unknown strategy: {impute}")
+    if np.isnan(fill):
+        missing = 0
+    column = _Multiset(values, fill, missing)
+
+    lower, upper = -np.inf, np.inf
+    if clip is not None and column.size and column.min() != column.max():
+        if clip == 'iqr':
+            q1, q3 = column.quantile([0.25, 0.75])
+            iqr = q3 - q1
+            lower, upper = q1 - threshold * iqr, q3 + threshold * iqr
+        elif clip == 'quantile':
+            lower, upper = column.quantile([lower_quantile, upper_quantile])
+        else:
+            raise ValueError(f"Unknown method: {clip}")
+        if np.isnan(lower):
+            lower = -np.inf
+        if np.isnan(upper):
+            upper = np.inf
+    column.lower, column.upper = lower, upper
+
+    if scale is None:
+        center, divisor = 0.0, 1.0
+    elif scale == 'minmax':
+        center = column.min()
+        divisor = column.max() - center
+    elif scale == 'standard':
+        center = column.mean()
+        divisor = np.sqrt(column.variance(center))
+    elif scale == 'robust':
+        q1, center, q3 = column.quantile([0.25, 0.5, 0.75])
+        divisor = q3 - q1
+    else:
+        raise ValueError(f"Unknown scaling method: {scale}")
+    if divisor == 0:
+        divisor = 1.0
+
+    return fill, lower, upper, center, divisor
+
+
+class _Multiset:
+    """Non-null values plus repeated fill values, optionally clipped to [lower, upper]."""
+
+    def __init__(self, values, fill, repeats):
+        self.values = values
+        self.fill = fill
+        self.repeats = repeats
+        self.size = values.size + repeats
+        self.lower, self.upper = -np.inf, np.inf
+        self._below_fill = int(np.count_nonzero(values < fill)) if repeats else 0
+
+    def _clip(self, v):
+        return np.clip(v, self.lower, self.upper)
+
+    def min(self):
+        if self.size == 0:
+            return np.nan
+        candidates = [self.values.min()] if self.values.size else []
+        if self.repeats:
+            candidates.append(self.fill)
+        return self._clip(min(candidates))
+
+    def max(self):
+        if self.size == 0:
+            return np.nan
+        candidates = [self.values.max()] if self.values.size else []
+        if self.repeats:
+            candidates.append(self.fill)
+        return self._clip(max(candidates))
+
+    def mean(self):
+        if self.size == 0:
+            return np.nan
+        total = self._clip(self.values).sum()
+        if self.repeats:
+            total += self.repeats * self._clip(self.fill)
+        return total / self.size
+
+    def variance(self, mean):
+        if self.size == 0:
+            return np.nan
+        squares = np.square(self._clip(self.values) - mean).sum()
+        if self.repeats:
+            squares += self.repeats * np.square(self._clip(self.fill) - mean)
+        return squares / self.size
+
+    def quantile(self, q):
+        """Linearly interpolated quantiles, selecting only the needed order statistics."""
+        if self.size == 0:
+            return np.full(len(q), np.nan)
+        h = np.asarray(q, dtype=np.float64) * (self.size - 1)
+        below = np.floor(h).astype(np.int64)
+        above = np.minimum(below + 1, self.size - 1)
+        gamma = h - below
+        ranks = np.concatenate([below, above])
+
+        # Ranks inside [_below_fill, _below_fill + repeats) are the fill value,
+        # later ranks are shifted past the fill copies into the non-null values.
+        in_fill = (ranks >= self._below_fill) & (ranks < self._below_fill + self.repeats)
+        index = np.where(ranks >= self._below_fill + self.repeats, ranks - self.repeats, ranks)
+        selected = np.unique(index[~in_fill])
+        if selected.size:
+            self.values = np.partition(self.values, selected)
+        stats = np.where(in_fill, self.fill, self.values[np.where(in_fill, 0, index)])
+        stats = self._clip(stats)
+
+        a, b = stats[:below.size], stats[below.size:]
+        diff = b - a
+        return np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+
+
+def _numpy_kernel(block, fill, lower, upper, center, divisor, out, block_rows=4096):
+    """Apply the fused transform tile by tile so each tile stays in cache."""
+    for start in range(0, block.shape[0], block_rows):
+        stop = start + block_rows
+        tile = out[start:stop]
+        np.copyto(tile, block[start:stop])
+        np.copyto(tile, np.broadcast_to(fill, tile.shape), where=np.isnan(tile))
+        np.clip(tile, lower, upper, out=tile)
+        tile -= center
+        tile /= divisor
+    return out
+
+
+_compiled_kernel = None
+
+
+def _numba_kernel():
+    """Compile the Numba kernel on first use."""
+    global _compiled_kernel
+    if _compiled_kernel is None:
+        @numba.njit(cache=True)
+        def kernel(block, fill, lower, upper, center, divisor, out):
+            n_rows, n_cols = block.shape
+            for j in range(n_cols):
+                for i in range(n_rows):
+                    v = block[i, j]
+                    if np.isnan(v):
+                        v = fill[j]
+                    if v < lower[j]:
+                        v = lower[j]
+                    elif v > upper[j]:
+                        v = upper[j]
+                    out[i, j] = (v - center[j]) / divisor[j]
+
+        _compiled_kernel = kernel
+    return _compiled_kernel
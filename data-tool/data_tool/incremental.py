@@ -0,0 +1,250 @@
+import functools
+import hashlib
+import os
+import pickle
+import types
+
+import pandas as pd
+
+from .profiling import DataFrameProfile, profile
+
+
+def _digest(obj):
+    return hashlib.sha256(pickle.dumps(obj, protocol=4)).hexdigest()
+
+
+def frame_fingerprint(df):
+    """Content fingerprint of a DataFrame: columns, dtypes and row hashes."""
+    digest = hashlib.sha256()
+    digest.update(pickle.dumps((list(df.columns), [str(t) for t in df.dtypes]), protocol=4))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _code_key(code):
+    consts = tuple(
+        _code_key(c) if isinstance(c, types.CodeType) else c
+        for c in code.co_consts
+    )
+    return code.co_code, consts, code.co_names
+
+
+def _value_key(value):
+    # nested functions are fingerprinted; everything else is pickled whole
+    if isinstance(value, (types.FunctionType, functools.partial)):
+        return transform_fingerprint(value)
+    return value
+
+
+def transform_fingerprint(transform):
+    """
+    Best-effort identity of a transform: its code, constants, defaults,
+    closure values and (for ``functools.partial``) bound arguments, all
+    hashed by their pickled contents.
+
+    Globals the transform reads are not covered; pass ``transform_key``
+    to ``run_incremental`` when the transform depends on them. Raises
+    ValueError if a captured value cannot be pickled.
+    """
+    if isinstance(transform, functools.partial):
+        key = (
+            transform_fingerprint(transform.func),
+            [_value_key(arg) for arg in transform.args],
+            sorted((name, _value_key(arg)) for name, arg in transform.keywords.items())
+        )
+    elif isinstance(transform, types.FunctionType):
+        key = (
+            transform.__module__, transform.__qualname__, _code_key(transform.__code__),
+            [_value_key(arg) for arg in transform.__defaults__ or ()],
+            sorted((name, _value_key(arg)) for name, arg in (transform.__kwdefaults__ or {}).items()),
+            [_value_key(cell.cell_contents) for cell in transform.__closure__ or ()]
+        )
+    else:
+        key = transform
+    try:
+        return _digest(key)
+    except (pickle.PicklingError, TypeError, AttributeError) as error:
+        raise ValueError(
+            f"Cannot fingerprint transform {transform!r}: {error}; "
+            f"pass transform_key to run_incremental"
+        ) from error
+
+
+def _profile_summary(prof):
+    return prof.to_frame().to_dict()
+
+
+def _load(source):
+    """Return (fingerprint, loader) for a partition given as DataFrame, path or callable."""
+    if isinstance(source, pd.DataFrame):
+        return frame_fingerprint(source), lambda: source
+    if isinstance(source, (str, os.PathLike)):
+        stat = os.stat(source)
+        fingerprint = _digest((os.fspath(source), stat.st_size, stat.st_mtime_ns))
+        if os.fspath(source).lower().endswith(('.parquet', '.pq')):
+            return fingerprint, lambda: pd.read_parquet(source)
+        return fingerprint, lambda: pd.read_csv(source)
+    if callable(source):
+        df = source()
+        return frame_fingerprint(df), lambda: df
+    raise TypeError(f"Unsupported partition source: {type(source).__name__}")
+
+
+class PartitionStore:
+    """
+    Persistent per-partition state kept in a directory.
+
+    For every partition it records the input fingerprint, the partition's
+    profile, the fingerprint of the global parameters its output was
+    computed with, and the output fingerprint. Outputs are stored next to
+    the state as one pickle per partition.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        os.makedirs(os.path.join(self.path, 'outputs'), exist_ok=True)
+        self._state_file = os.path.join(self.path, 'state.pkl')
+        self.partitions = {}
+        if os.path.exists(self._state_file):
+            with open(self._state_file, 'rb') as f:
+                self.partitions = pickle.load(f)
+
+    def output_path(self, name):
+        return os.path.join(self.path, 'outputs', f"{name}.pkl")
+
+    def read_output(self, name):
+        return pd.read_pickle(self.output_path(name))
+
+    def write_output(self, name, df):
+        df.to_pickle(self.output_path(name))
+
+    def remove(self, name):
+        self.partitions.pop(name, None)
+        if os.path.exists(self.output_path(name)):
+            os.remove(self.output_path(name))
+
+    def save(self):
+        tmp = self._state_file + '.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump(self.partitions, f, protocol=4)
+        os.replace(tmp, self._state_file)
+
+
+class IncrementalReport:
+    """What an incremental run reused versus recomputed."""
+
+    def __init__(self):
+        self.statistics_computed = []
+        self.statistics_reused = []
+        self.outputs_computed = []
+        self.outputs_reused = []
+        self.removed = []
+        self.params_changed = False
+
+    def to_frame(self):
+        rows = {}
+        for name in self.statistics_computed + self.statistics_reused:
+            rows[name] = {
+                'statistics': 'computed' if name in self.statistics_computed else 'reused',
+                'output': 'computed' if name in self.outputs_computed else 'reused'
+            }
+        return pd.DataFrame.from_dict(rows, orient='index', columns=['statistics', 'output'])
+
+    def __str__(self):
+        return (
+            f"{self.to_frame()}\n"
+            f"global parameters changed: {self.params_changed}; removed: {self.removed}"
+        )
+
+
+def run_incremental(partitions, transform, store, params=None, columns=None,
+                    transform_key=None):
+    """
+    Transform append-only partitions, redoing only what changed.
+
+    Per-partition profiles are kept in ``store`` and recomputed only for
+    new or modified partitions; the global profile is their merge. A
+    partition is re-transformed only if its input changed, or the global
+    parameters or the transform differ from those its stored output was
+    computed with.
+
+    Parameters:
+    partitions : dict
+        {name: DataFrame, CSV/Parquet path or callable returning a DataFrame}
+    transform : callable
+        ``transform(df, profile)`` returning the transformed partition; it
+        must depend on the global profile only through ``params(profile)``
+    store : PartitionStore or str
+        State store (or its directory)
+    params : callable, optional
+        Extracts the global parameters the transform uses from the merged
+        profile (default: the profile summary, so any change in the
+        global statistics re-transforms every partition)
+    columns : list, optional
+        Columns to profile (default all columns)
+    transform_key : hashable, optional
+        Version of the transform; stored outputs are reused only under the
+        same key (default: ``transform_fingerprint(transform)``, which
+        requires the values the transform captures to be picklable)
+
+    Returns:
+    tuple
+        (outputs, report): {name: transformed DataFrame} for all partitions,
+        and an IncrementalReport
+    """
+    if not isinstance(store, PartitionStore):
+        store = PartitionStore(store)
+    if params is None:
+        params = _profile_summary
+    report = IncrementalReport()
+
+    for name in list(store.partitions):
+        if name not in partitions:
+            store.remove(name)
+            report.removed.append(name)
+
+    loaders = {}
+    changed = set()
+    for name in sorted(partitions):
+        fingerprint, loaders[name] = _load(partitions[name])
+        state = store.partitions.get(name)
+        if state is not None and state['input'] == fingerprint:
+            report.statistics_reused.append(name)
+            continue
+        store.partitions[name] = {
+            'input': fingerprint,
+            'profile': profile(loaders[name](), columns=columns),
+            'params': None,
+            'output': None
+        }
+        changed.add(name)
+        report.statistics_computed.append(name)
+
+    global_profile = DataFrameProfile()
+    for name in sorted(partitions):
+        global_profile = global_profile.merge(store.partitions[name]['profile'])
+    if transform_key is None:
+        transform_key = transform_fingerprint(transform)
+    params_fingerprint = _digest((params(global_profile), transform_key))
+
+    outputs = {}
+    for name in sorted(partitions):
+        state = store.partitions[name]
+        if state['params'] is not None and state['params'] != params_fingerprint:
+            report.params_changed = True
+        if (name not in changed and state['params'] == params_fingerprint
+                and os.path.exists(store.output_path(name))):
+            stored = store.read_output(name)
+            if frame_fingerprint(stored) == state['output']:
+                outputs[name] = stored
+                report.outputs_reused.append(name)
+                continue
+        result = transform(loaders[name](), global_profile)
+        store.write_output(name, result)
+        state['params'] = params_fingerprint
+        state['output'] = frame_fingerprint(result)
+        outputs[name] = result
+        report.outputs_computed.append(name)
+
+    store.save()
+    return outputs, report
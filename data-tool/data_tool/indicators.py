@@ -0,0 +1,123 @@
+"""
+Compact missing-value indicators.
+
+Stores which cells of each column were missing either as a packed bitmask
+(``np.packbits``, one bit per cell) or as a sparse list of missing row
+positions, and unpacks selected columns on demand.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse as sp
+
+FORMATS = ('bitmask', 'sparse')
+
+
+class MissingIndicators:
+    """
+    Per-column missingness of a DataFrame.
+
+    Parameters:
+    index : pandas.Index
+        Row index of the frame the masks describe
+    masks : dict
+        {column: boolean numpy array}, True where the cell was missing
+    format : str, optional
+        'bitmask' packs every column to ``ceil(n_rows / 8)`` bytes;
+        'sparse' keeps only the positions of missing cells, which is
+        smaller when fewer than about 1 in 64 cells are missing
+    """
+
+    def __init__(self, index, masks, format='bitmask'):
+        if format not in FORMATS:
+            raise ValueError(f"format must be one of {FORMATS}, got {format!r}")
+        self.index = index
+        self.columns = list(masks)
+        self.format = format
+        self._positions = {col: i for i, col in enumerate(self.columns)}
+        if format == 'bitmask':
+            width = (len(index) + 7) // 8
+            self._data = np.zeros((len(self.columns), width), dtype=np.uint8)
+            for i, mask in enumerate(masks.values()):
+                self._data[i] = np.packbits(mask)
+        else:
+            self._data = [np.flatnonzero(mask) for mask in masks.values()]
+
+    @property
+    def n_rows(self):
+        return len(self.index)
+
+    @property
+    def nbytes(self):
+        if self.format == 'bitmask':
+            return self._data.nbytes
+        return sum(rows.nbytes for rows in self._data)
+
+    def __contains__(self, column):
+        return column in self._positions
+
+    def __getitem__(self, column):
+        return self.column(column)
+
+    def _slot(self, column):
+        try:
+            return self._positions[column]
+        except KeyError:
+            raise KeyError(f"No missing-value indicator for column {column}") from None
+
+    def rows(self, column):
+        """Positions of the rows where ``column`` was missing."""
+        slot = self._slot(column)
+        if self.format == 'sparse':
+            return self._data[slot]
+        return np.flatnonzero(np.unpackbits(self._data[slot], count=self.n_rows))
+
+    def column(self, column):
+        """Boolean mask of ``column``, True where the value was missing."""
+        slot = self._slot(column)
+        if self.format == 'bitmask':
+            return np.unpackbits(self._data[slot], count=self.n_rows).view(bool)
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[self._data[slot]] = True
+        return mask
+
+    def counts(self):
+        """Number of missing cells per column."""
+        if self.format == 'bitmask':
+            counts = np.unpackbits(self._data, axis=1, count=self.n_rows).sum(axis=1)
+        else:
+            counts = [rows.size for rows in self._data]
+        return pd.Series(counts, index=self.columns, dtype=np.int64)
+
+    def to_frame(self, columns=None, suffix='_missing'):
+        """
+        Unpack indicators into a boolean DataFrame aligned with the data.
+
+        Parameters:
+        columns : list, optional
+            Columns to unpack (default all)
+        suffix : str, optional
+            Appended to the column names
+        """
+        columns = self.columns if columns is None else columns
+        return pd.DataFrame(
+            {f"{col}{suffix}": self.column(col) for col in columns},
+            index=self.index
+        )
+
+    def to_sparse(self, columns=None):
+        """Indicators as a ``scipy.sparse.csc_matrix`` of shape (n_rows, n_columns)."""
+        columns = self.columns if columns is None else columns
+        rows = [self.rows(col) for col in columns]
+        indptr = np.concatenate([[0], np.cumsum([r.size for r in rows])])
+        indices = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        return sp.csc_matrix(
+            (np.ones(indices.size, dtype=bool), indices, indptr),
+            shape=(self.n_rows, len(columns))
+        )
+
+    def __repr__(self):
+        return (
+            f"MissingIndicators({len(self.columns)} columns x {self.n_rows} rows, "
+            f"format={self.format!r}, {self.nbytes} bytes)"
+        )
@@ -0,0 +1,166 @@
+"""
+Dtype-specialized median, mode and quantile kernels.
+
+- categorical columns and integer columns whose value range is small
+  relative to their length are counted with ``np.bincount``; order
+  statistics come from the cumulative counts
+- other numeric columns select order statistics with ``np.partition`` on
+  the non-null values only
+
+Everything else (including modes of float and nullable integer columns)
+falls back to the pandas implementation. Results match pandas: quantiles
+use numpy's linear interpolation, medians average the two middle values
+like ``Series.median``, and ties in the mode go to the smallest value
+(first category).
+"""
+
+import numpy as np
+import pandas as pd
+
+# Largest value range counted with np.bincount (8 bytes per slot)
+MAX_COUNT_SPAN = 1 << 22
+
+
+def _values(series):
+    """
+    Non-null values of a numeric column as a numpy array, or None.
+
+    Integer columns without a missing-value mask are returned without a
+    copy; every other result is a fresh array.
+    """
+    dtype = series.dtype
+    if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        return None
+    if not isinstance(dtype, np.dtype):
+        # nullable extension array: fill, then drop the masked slots
+        array = series.array
+        kind = dtype.numpy_dtype if dtype.kind in 'iu' else np.float64
+        return array.to_numpy(dtype=kind, na_value=0)[~array.isna()]
+    values = series.to_numpy()
+    if dtype.kind == 'f':
+        return values[~np.isnan(values)]
+    return values
+
+
+def _counts(values):
+    """
+    Return (counts, offset) of non-empty integer values, or None.
+
+    ``counts[i]`` is the number of values equal to ``offset + i``, with
+    ``offset`` in the values' dtype; None when the value range is too wide
+    for counting to pay off.
+    """
+    low, high = int(values.min()), int(values.max())
+    span = high - low + 1
+    if span > MAX_COUNT_SPAN or span > 4 * values.size + 1024:
+        return None
+    if values.dtype.kind == 'u':
+        # unsigned values may not fit in int64; subtract in their own dtype
+        shifted = values - values.dtype.type(low)
+    else:
+        # widen first: narrow signed dtypes would wrap around
+        shifted = values.astype(np.int64) - low
+    return np.bincount(shifted.astype(np.intp, copy=False), minlength=span), values.dtype.type(low)
+
+
+def _lerp(low, high, fraction):
+    # numpy's linear interpolation formula, as used by Series.quantile
+    diff = high - low
+    return np.where(fraction >= 0.5, high - diff * (1 - fraction), low + diff * fraction)
+
+
+def _quantiles_from_order_statistics(select, n, probs):
+    positions = np.asarray(probs, dtype=np.float64) * (n - 1)
+    below = np.floor(positions).astype(np.int64)
+    above = np.ceil(positions).astype(np.int64)
+    ranks = np.unique(np.concatenate([below, above]))
+    stats = dict(zip(ranks.tolist(), select(ranks)))
+    low = np.array([stats[k] for k in below.tolist()], dtype=np.float64)
+    high = np.array([stats[k] for k in above.tolist()], dtype=np.float64)
+    return _lerp(low, high, positions - below)
+
+
+def _selector(series):
+    """
+    Return (n, select) for a numeric column, or None for other columns.
+
+    ``select(ranks)`` returns the order statistics at the given 0-based
+    ranks of the ``n`` non-null values.
+    """
+    if pd.api.types.is_bool_dtype(series.dtype):
+        series = series.astype('UInt8' if series.hasnans else np.uint8)
+    values = _values(series)
+    if values is None:
+        return None
+
+    counted = _counts(values) if values.dtype.kind in 'iu' and values.size else None
+    if counted is not None:
+        counts, offset = counted
+        cumulative = np.cumsum(counts)
+        return values.size, lambda ranks: offset + np.searchsorted(
+            cumulative, ranks, side='right').astype(values.dtype)
+
+    if values.dtype.kind in 'iu' and isinstance(series.dtype, np.dtype):
+        values = values.copy()
+
+    def select(ranks):
+        values.partition(ranks)
+        return values[ranks]
+
+    return values.size, select
+
+
+def quantiles(series, probs):
+    """
+    Quantiles of a column with linear interpolation.
+
+    Parameters:
+    series : pandas.Series
+        Input column
+    probs : sequence of float
+        Probabilities in [0, 1]
+
+    Returns:
+    numpy.ndarray
+        One quantile per probability (NaN for an all-missing column);
+        float64 for numeric columns, the column's own type otherwise
+        (e.g. datetime64)
+    """
+    probs = np.asarray(probs, dtype=np.float64)
+    selector = _selector(series)
+    if selector is None:
+        return series.quantile(probs).to_numpy()
+    n, select = selector
+    if n == 0:
+        return np.full(probs.shape, np.nan)
+    return _quantiles_from_order_statistics(select, n, probs)
+
+
+def median(series):
+    """Median of a column, NaN if it has no values."""
+    selector = _selector(series)
+    if selector is None:
+        return series.median()
+    n, select = selector
+    if n == 0:
+        return np.nan
+    # mean of the two middle values, exactly as Series.median computes it
+    low, high = np.asarray(select(np.array([(n - 1) // 2, n // 2])), dtype=np.float64)
+    return float((low + high) / 2)
+
+
+def mode(series):
+    """Most frequent non-null value of a column, None if it has no values."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(series.dtype.categories))
+        return series.dtype.categories[np.argmax(counts)] if counts.sum() else None
+    # for nullable integers dropping the mask costs more than counting saves
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iu':
+        values = _values(series)
+        counted = _counts(values) if values.size else None
+        if counted is not None:
+            counts, offset = counted
+            return offset + series.dtype.type(np.argmax(counts))
+    mode_vals = series.mode()
+    return mode_vals[0] if not mode_vals.empty else None
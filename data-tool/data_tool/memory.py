@@ -0,0 +1,277 @@
+import os
+import re
+import sys
+import tempfile
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from .cleaning import handle_missing_values, remove_duplicates, clip_outliers, missing_value_fills
+from .encoding import one_hot_encode, label_encode, hash_encode
+from .scaling import minmax_scale, standard_scale, robust_scale
+from .fused import fused_numeric_transform
+from .profiling import profile
+from .sketches import HyperLogLog
+from .steps import (
+    ROW_LOCAL, NEEDS_PROFILE, step_columns, check_categories, check_quantiles, needs_exact_categories
+)
+
+_UNITS = {
+    '': 1, 'b': 1,
+    'kb': 10 ** 3, 'mb': 10 ** 6, 'gb': 10 ** 9, 'tb': 10 ** 12,
+    'kib': 2 ** 10, 'mib': 2 ** 20, 'gib': 2 ** 30, 'tib': 2 ** 40,
+}
+
+_memory_limit = None
+
+
+def parse_memory(limit):
+    """Convert a byte count or a string like '512MB' / '2GiB' to bytes."""
+    if limit is None or isinstance(limit, (int, np.integer)):
+        return limit
+    match = re.fullmatch(r'\s*([\d.]+)\s*([a-zA-Z]*)\s*', str(limit))
+    if not match or match.group(2).lower() not in _UNITS:
+        raise ValueError(f"Cannot parse memory limit: {limit!r}")
+    return int(float(match.group(1)) * _UNITS[match.group(2).lower()])
+
+
+def set_memory_limit(limit):
+    """Set the default memory budget for ``apply_with_memory_limit`` (None disables it)."""
+    global _memory_limit
+    _memory_limit = parse_memory(limit)
+
+
+def get_memory_limit():
+    return _memory_limit
+
+
+def _column_bytes(df, sample_size=1000):
+    """
+    Bytes held by each column's values.
+
+    Object columns are sized from a sample of their elements instead of
+    ``memory_usage(deep=True)``, which would touch every Python object.
+    """
+    sizes = {}
+    for col in df.columns:
+        series = df[col]
+        if series.dtype == object and len(series):
+            sample = series.to_numpy()[::max(1, len(series) // sample_size)]
+            per_item = sum(sys.getsizeof(v) for v in sample) / len(sample)
+            sizes[col] = int(len(series) * (8 + per_item))
+        else:
+            sizes[col] = int(series.array.nbytes)
+    return pd.Series(sizes, dtype='int64')
+
+
+def _copy_bytes(df):
+    """Bytes allocated by ``df.copy()``: object columns only copy their pointers."""
+    return int(sum(
+        8 * len(df) if df[col].dtype == object else df[col].array.nbytes
+        for col in df.columns
+    ))
+
+
+def _cardinality(df, col, kwargs):
+    prof = kwargs.get('profile')
+    if prof is not None and col in prof:
+        return prof[col].nunique
+    return int(round(HyperLogLog().update(df[col].dropna().to_numpy()).estimate()))
+
+
+def estimate_memory(df, func, **kwargs):
+    """
+    Estimate the memory a data_tool step allocates beyond its input.
+
+    Accounts for the ``df.copy()`` each function makes, per-column
+    temporaries, and the width of the output (including the dummy columns
+    of ``one_hot_encode`` and the buckets of ``hash_encode``).
+
+    Parameters:
+    df : pandas.DataFrame
+        Input DataFrame
+    func : callable
+        data_tool function to size
+    **kwargs
+        Arguments the function would be called with
+
+    Returns:
+    tuple of int
+        (working_bytes, output_bytes): peak additional allocation and the
+        size of the result
+    """
+    n = len(df)
+    copy = _copy_bytes(df)
+    columns = step_columns(func, df, kwargs)
+    block = 8 * n * len(columns)
+
+    if func is handle_missing_values:
+        sizes = _column_bytes(df[columns]) if columns else pd.Series([0])
+        return copy + 2 * int(sizes.max()) + n, copy
+    if func is remove_duplicates:
+        return copy + 8 * n * (len(columns) + 1) + n, copy
+    if func is clip_outliers:
+        return copy + 3 * block, copy
+    if func in (minmax_scale, standard_scale, robust_scale):
+        return copy + 2 * block, copy
+    if func is fused_numeric_transform:
+        return copy + 3 * block, copy
+    if func is label_encode:
+        return copy + 16 * n, copy
+    if func is one_hot_encode:
+        max_categories = kwargs.get('max_categories')
+        width = 0
+        for col in columns:
+            k = _cardinality(df, col, kwargs)
+            if max_categories is not None:
+                k = min(k, max_categories) + 1
+            width += k
+        output = copy - 8 * n * len(columns) + 8 * n * width
+        return copy + 2 * output, output
+    if func is hash_encode:
+        n_features = kwargs.get('n_features', 256)
+        per_column = 13 * n if kwargs.get('sparse') else n * n_features
+        output = copy - 8 * n * len(columns) + per_column * len(columns)
+        return copy + 2 * output, output
+    return 3 * copy, copy
+
+
+def choose_chunksize(df, func, memory_limit=None, **kwargs):
+    """Largest row count whose working set for ``func`` fits in ``memory_limit``."""
+    limit = parse_memory(memory_limit) if memory_limit is not None else _memory_limit
+    if limit is None:
+        raise ValueError("No memory limit given and no default set with set_memory_limit")
+    working, _ = estimate_memory(df, func, **kwargs)
+    per_row = working / max(len(df), 1)
+    return max(1, int(limit // per_row)) if per_row else len(df)
+
+
+def _with_constant_fills(df, kwargs):
+    """Replace the fill strategies of handle_missing_values by constants computed on all of ``df``."""
+    kwargs = dict(kwargs)
+    options = {key: kwargs.pop(key) for key in
+               ('strategy', 'columns', 'fill_value', 'profile', 'approx', 'sample_size', 'random_state')
+               if key in kwargs}
+    options.setdefault('strategy', 'drop')
+    kwargs['strategy'], kwargs['fill_value'] = missing_value_fills(df, **options)
+    if not isinstance(kwargs['strategy'], dict) and 'columns' in options:
+        kwargs['columns'] = options['columns']
+    return kwargs
+
+
+def _quantile_capacity(df, columns, limit):
+    """Sketch capacity holding every value of ``columns`` if that fits in ``limit``."""
+    if 8 * len(df) * len(columns) <= limit:
+        return max(2048, len(df))
+    warnings.warn(
+        f"Keeping every value of {len(columns)} columns for exact quantiles exceeds the "
+        f"{limit} byte limit; chunked quantiles are approximate (quantile sketch)",
+        stacklevel=3
+    )
+    return 2048
+
+
+def apply_with_memory_limit(df, func, memory_limit=None, on_overflow='raise',
+                            spill_dir=None, **kwargs):
+    """
+    Run a data_tool step within a memory budget.
+
+    The step runs directly when its estimated working set fits. Otherwise
+    row-wise steps are applied chunk by chunk, with global statistics
+    (means, quantiles, category sets) taken from a profile that is
+    computed first, so every chunk is transformed consistently.
+
+    The automatic profile keeps every value for quantiles (clip_outliers,
+    robust_scale) while that fits the budget, so results do not depend on
+    it; otherwise quantiles come from a compacted sketch and a warning is
+    issued. handle_missing_values computes its means, medians and modes
+    from the full columns, one column at a time, before chunking, and
+    cannot return missing-value indicators when chunked.
+
+    Parameters:
+    df : pandas.DataFrame
+        Input DataFrame
+    func : callable
+        data_tool function to apply
+    memory_limit : int or str, optional
+        Budget in bytes or as '512MB', '4GiB' (default: ``set_memory_limit``)
+    on_overflow : {'raise', 'stream', 'spill'}, optional
+        What to do when even the chunked result does not fit: raise
+        MemoryError, return an iterator of transformed chunks, or write the
+        chunks to ``spill_dir`` and return their paths
+    spill_dir : str, optional
+        Directory for spilled chunks (default: a new temporary directory)
+    **kwargs
+        Arguments for ``func``
+
+    Returns:
+    pandas.DataFrame, iterator of pandas.DataFrame or list of str
+        Result, or the streamed / spilled chunks of it
+    """
+    if on_overflow not in ('raise', 'stream', 'spill'):
+        raise ValueError(f"Unknown on_overflow: {on_overflow}")
+    limit = parse_memory(memory_limit) if memory_limit is not None else _memory_limit
+    if limit is None:
+        return func(df, **kwargs)
+
+    working, output = estimate_memory(df, func, **kwargs)
+    if working <= limit:
+        return func(df, **kwargs)
+
+    chunkable = func in ROW_LOCAL or func in NEEDS_PROFILE
+    if func is handle_missing_values and kwargs.get('strategy', 'drop') == 'drop':
+        chunkable = True
+    if not chunkable:
+        raise MemoryError(
+            f"{func.__name__} needs about {working} bytes, over the {limit} byte limit, "
+            f"and cannot be split into row chunks"
+        )
+
+    per_row = working / len(df)
+    if func is handle_missing_values:
+        if kwargs.get('indicators') is not None:
+            raise ValueError(
+                "handle_missing_values cannot return missing-value indicators when chunked; "
+                "compute them with df.isna() or raise the memory limit"
+            )
+        kwargs = _with_constant_fills(df, kwargs)
+    elif func in NEEDS_PROFILE and kwargs.get('profile') is None:
+        columns = step_columns(func, df, kwargs)
+        options = {}
+        if needs_exact_categories(func, kwargs):
+            # every chunk must see the full vocabulary, however large
+            options['max_heavy_hitters'] = max([1024] + [df[col].nunique() + 1 for col in columns])
+        if func in (clip_outliers, robust_scale):
+            options['quantile_capacity'] = _quantile_capacity(df, columns, limit)
+        kwargs['profile'] = profile(df, columns=columns, chunksize=max(1, int(limit // per_row)),
+                                    **options)
+    if func in NEEDS_PROFILE and func is not handle_missing_values:
+        check_categories(func, kwargs['profile'], kwargs)
+        check_quantiles(func, kwargs['profile'], kwargs)
+
+    # Accumulating the chunk results and concatenating them holds two copies of the output.
+    fits = 2 * output < limit
+    budget = limit - 2 * output if fits else limit
+    chunksize = max(1, int(budget // per_row))
+    chunks = (
+        func(df.iloc[start:start + chunksize], **kwargs)
+        for start in range(0, len(df), chunksize)
+    )
+
+    if fits:
+        return pd.concat(list(chunks))
+    if on_overflow == 'stream':
+        return chunks
+    if on_overflow == 'spill':
+        spill_dir = spill_dir or tempfile.mkdtemp(prefix='data_tool-spill-')
+        paths = []
+        for i, chunk in enumerate(chunks):
+            path = os.path.join(spill_dir, f"chunk-{i:05d}.pkl")
+            chunk.to_pickle(path)
+            paths.append(path)
+        return paths
+    raise MemoryError(
+        f"{func.__name__} output needs about {output} bytes, over the {limit} byte limit; "
+        f"use on_overflow='stream' or 'spill'"
+    )
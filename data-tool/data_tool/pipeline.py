@@ -0,0 +1,200 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+_DONE = object()
+
+
+class StageStats:
+    """Rows processed and busy time of one pipeline stage."""
+
+    def __init__(self, name):
+        self.name = name
+        self.chunks = 0
+        self.rows = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else float('nan')
+
+
+class PipelineReport:
+    """Throughput of the read, transform and write stages of a pipeline run."""
+
+    def __init__(self):
+        self.stages = {name: StageStats(name) for name in ('read', 'transform', 'write')}
+        self.wall_seconds = 0.0
+
+    def __getitem__(self, stage):
+        return self.stages[stage]
+
+    def to_frame(self):
+        return pd.DataFrame({
+            name: {
+                'chunks': s.chunks,
+                'rows': s.rows,
+                'busy_seconds': s.seconds,
+                'rows_per_second': s.rows_per_second
+            }
+            for name, s in self.stages.items()
+        }).T
+
+    def __str__(self):
+        return f"{self.to_frame()}\nwall time: {self.wall_seconds:.3f}s"
+
+
+async def arun_pipeline(reader, transform, writer, max_queue=2, executor=None):
+    """
+    Read, transform and write chunks concurrently.
+
+    While chunk ``i`` is being transformed, chunk ``i + 1`` is read and
+    chunk ``i - 1`` is written. Stages are connected by bounded queues, so
+    a slow stage applies backpressure instead of letting chunks pile up in
+    memory. Output order matches input order.
+
+    Parameters:
+    reader : iterable of pandas.DataFrame
+        Source of chunks, e.g. ``read_chunks(path)``
+    transform : callable
+        Function mapping a chunk to its transformed chunk
+    writer : callable
+        Function consuming each transformed chunk, e.g. ``ChunkWriter(path)``
+    max_queue : int, optional
+        Maximum number of chunks waiting between two stages
+    executor : concurrent.futures.Executor, optional
+        Executor for ``transform`` (default: a single worker thread); pass a
+        ProcessPoolExecutor for transforms that hold the GIL
+
+    Returns:
+    PipelineReport
+        Per-stage rows, busy time and rows/s
+    """
+    loop = asyncio.get_running_loop()
+    report = PipelineReport()
+    to_transform = asyncio.Queue(max_queue)
+    to_write = asyncio.Queue(max_queue)
+    chunks = iter(reader)
+    io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='data_tool-io')
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='data_tool-cpu')
+
+    async def timed(stage, pool, func, *args):
+        start = time.perf_counter()
+        result = await loop.run_in_executor(pool, func, *args)
+        report[stage].seconds += time.perf_counter() - start
+        return result
+
+    async def read():
+        while True:
+            chunk = await timed('read', io_pool, next, chunks, _DONE)
+            if chunk is _DONE:
+                break
+            report['read'].chunks += 1
+            report['read'].rows += len(chunk)
+            await to_transform.put(chunk)
+        await to_transform.put(_DONE)
+
+    async def compute():
+        while (chunk := await to_transform.get()) is not _DONE:
+            result = await timed('transform', executor, transform, chunk)
+            report['transform'].chunks += 1
+            report['transform'].rows += len(result)
+            await to_write.put(result)
+        await to_write.put(_DONE)
+
+    async def write():
+        while (chunk := await to_write.get()) is not _DONE:
+            await timed('write', io_pool, writer, chunk)
+            report['write'].chunks += 1
+            report['write'].rows += len(chunk)
+
+    start = time.perf_counter()
+    tasks = [asyncio.ensure_future(stage()) for stage in (read, compute, write)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        io_pool.shutdown(wait=True)
+        if own_executor:
+            executor.shutdown(wait=True)
+        report.wall_seconds = time.perf_counter() - start
+    return report
+
+
+def run_pipeline(reader, transform, writer, max_queue=2, executor=None):
+    """Synchronous wrapper around ``arun_pipeline``; see its documentation."""
+    return asyncio.run(arun_pipeline(reader, transform, writer, max_queue, executor))
+
+
+def _is_parquet(path):
+    return os.fspath(path).lower().endswith(('.parquet', '.pq'))
+
+
+def read_chunks(path, chunksize=100_000, **kwargs):
+    """
+    Iterate over a CSV or Parquet file in chunks of about ``chunksize`` rows.
+
+    Parquet support requires pyarrow. Extra keyword arguments go to
+    ``pd.read_csv`` or ``ParquetFile.iter_batches``.
+    """
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, **kwargs):
+            yield batch.to_pandas()
+    else:
+        with pd.read_csv(path, chunksize=chunksize, **kwargs) as chunks:
+            yield from chunks
+
+
+class ChunkWriter:
+    """
+    Append chunks to a CSV or Parquet file; use as a context manager.
+
+    Parquet support requires pyarrow.
+    """
+
+    def __init__(self, path, **kwargs):
+        self.path = path
+        self.kwargs = kwargs
+        self._parquet_writer = None
+        self._started = False
+
+    def __call__(self, chunk):
+        if _is_parquet(self.path):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema, **self.kwargs)
+            self._parquet_writer.write_table(table)
+        else:
+            chunk.to_csv(
+                self.path,
+                mode='a' if self._started else 'w',
+                header=not self._started,
+                index=False,
+                **self.kwargs
+            )
+        self._started = True
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,239 @@
+import numpy as np
+import pandas as pd
+
+from .sketches import HeavyHitters, HyperLogLog, QuantileSketch
+
+
+class ColumnProfile:
+    """
+    Mergeable statistics of a single column.
+
+    Tracks count, null count, min/max, mean/variance, a quantile sketch
+    (numeric columns only), an approximate distinct count and the most
+    frequent values.
+    """
+
+    # False once min/max turned out to be undefined for the column's values
+    _ordered = True
+
+    def __init__(self, name, numeric, quantile_capacity=2048,
+                 max_heavy_hitters=1024, hll_precision=12):
+        self.name = name
+        self.numeric = numeric
+        self.count = 0
+        self.null_count = 0
+        self.min = None
+        self.max = None
+        self.mean = np.nan
+        self._m2 = 0.0
+        self.quantiles = QuantileSketch(quantile_capacity) if numeric else None
+        self.distinct = HyperLogLog(hll_precision)
+        self.heavy_hitters = HeavyHitters(max_heavy_hitters)
+
+    def update(self, series):
+        values = series.dropna()
+        self.null_count += len(series) - len(values)
+        if len(values) == 0:
+            return self
+
+        if self.numeric:
+            array = values.to_numpy(dtype=np.float64)
+            n = array.size
+            mean = array.mean()
+            m2 = float(np.square(array - mean).sum())
+            self._merge_moments(n, mean, m2)
+            self.quantiles.update(array)
+        else:
+            self.count += len(values)
+
+        if self._ordered:
+            try:
+                low, high = values.min(), values.max()
+                self.min = low if self.min is None else min(self.min, low)
+                self.max = high if self.max is None else max(self.max, high)
+            except TypeError:
+                # unordered categoricals and mixed-type object columns
+                self._ordered = False
+                self.min = self.max = None
+        self.distinct.update(values.to_numpy())
+        self.heavy_hitters.update(values)
+        return self
+
+    def _merge_moments(self, n, mean, m2):
+        if self.count == 0:
+            self.count, self.mean, self._m2 = n, mean, m2
+            return
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean = self.mean + delta * n / total
+        self._m2 = self._m2 + m2 + delta * delta * self.count * n / total
+        self.count = total
+
+    def merge(self, other):
+        """Return the profile of the concatenation of both inputs."""
+        if other.numeric != self.numeric:
+            raise ValueError(f"Cannot merge numeric and non-numeric profiles of column {self.name}")
+        merged = ColumnProfile(self.name, self.numeric)
+        merged.null_count = self.null_count + other.null_count
+        merged.count, merged.mean, merged._m2 = self.count, self.mean, self._m2
+        if self.numeric:
+            if other.count:
+                merged._merge_moments(other.count, other.mean, other._m2)
+            merged.quantiles = self.quantiles.merge(other.quantiles)
+        else:
+            merged.count += other.count
+        merged._ordered = self._ordered and other._ordered
+        if merged._ordered:
+            try:
+                bounds = [b for b in (self.min, other.min) if b is not None]
+                merged.min = min(bounds) if bounds else None
+                bounds = [b for b in (self.max, other.max) if b is not None]
+                merged.max = max(bounds) if bounds else None
+            except TypeError:
+                merged._ordered = False
+                merged.min = merged.max = None
+        merged.distinct = self.distinct.merge(other.distinct)
+        merged.heavy_hitters = self.heavy_hitters.merge(other.heavy_hitters)
+        return merged
+
+    def variance(self, ddof=0):
+        if self.count - ddof <= 0:
+            return np.nan
+        return self._m2 / (self.count - ddof)
+
+    def std(self, ddof=0):
+        return float(np.sqrt(self.variance(ddof)))
+
+    def quantile(self, q):
+        """Exact up to ``quantile_capacity`` values, a sketch estimate beyond."""
+        if not self.numeric:
+            raise TypeError(f"Quantiles are not available for non-numeric column {self.name}")
+        return self.quantiles.quantile(q)
+
+    def median(self):
+        return self.quantile(0.5)
+
+    def mode(self):
+        """Most frequent value; only guaranteed when ``mode_is_exact``."""
+        return self.heavy_hitters.mode()
+
+    @property
+    def mode_is_exact(self):
+        return self.heavy_hitters.mode_is_exact
+
+    @property
+    def is_constant(self):
+        if not self._ordered:
+            return self.count > 0 and self.nunique == 1
+        return self.count > 0 and self.min == self.max
+
+    @property
+    def nunique(self):
+        """Distinct non-null values: exact for small vocabularies, HyperLogLog estimate otherwise."""
+        if self.heavy_hitters.is_exact:
+            return len(self.heavy_hitters.counts)
+        return int(round(self.distinct.estimate()))
+
+    @property
+    def categories(self):
+        """Sorted distinct values, or None if the vocabulary exceeded the heavy-hitter capacity."""
+        if not self.heavy_hitters.is_exact:
+            return None
+        values = list(self.heavy_hitters.counts.index)
+        try:
+            return sorted(values)
+        except TypeError:
+            return values
+
+
+class DataFrameProfile:
+    """Mapping of column name to ColumnProfile; mergeable across chunks and files."""
+
+    def __init__(self, columns=None, n_rows=0):
+        self.columns = dict(columns or {})
+        self.n_rows = n_rows
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    def __contains__(self, column):
+        return column in self.columns
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __len__(self):
+        return len(self.columns)
+
+    def get(self, column, default=None):
+        return self.columns.get(column, default)
+
+    def update(self, df, **options):
+        for col in df.columns:
+            if col not in self.columns:
+                numeric = pd.api.types.is_numeric_dtype(df[col])
+                self.columns[col] = ColumnProfile(col, numeric, **options)
+            self.columns[col].update(df[col])
+        self.n_rows += len(df)
+        return self
+
+    def merge(self, other):
+        merged = DataFrameProfile(self.columns, self.n_rows + other.n_rows)
+        for col, col_profile in other.columns.items():
+            if col in merged.columns:
+                merged.columns[col] = merged.columns[col].merge(col_profile)
+            else:
+                merged.columns[col] = col_profile
+        return merged
+
+    def to_frame(self):
+        """Summarize the profile as a DataFrame with one row per column."""
+        rows = {}
+        for col, p in self.columns.items():
+            rows[col] = {
+                'count': p.count,
+                'null_count': p.null_count,
+                'min': p.min,
+                'max': p.max,
+                'mean': p.mean if p.numeric else None,
+                'std': p.std() if p.numeric else None,
+                'median': p.median() if p.numeric else None,
+                'nunique': p.nunique,
+                'mode': p.mode(),
+            }
+        return pd.DataFrame.from_dict(rows, orient='index')
+
+
+def profile(df, columns=None, chunksize=None, **options):
+    """
+    Compute mergeable column statistics in one pass over the data.
+
+    Parameters:
+    df : pandas.DataFrame or iterable of pandas.DataFrame
+        Input DataFrame, or chunks of one (e.g. ``pd.read_csv(..., chunksize=n)``)
+    columns : list, optional
+        Columns to profile (default all columns)
+    chunksize : int, optional
+        Process an in-memory DataFrame in row chunks of this size
+    **options
+        Sketch sizes passed to ColumnProfile: ``quantile_capacity``,
+        ``max_heavy_hitters``, ``hll_precision``
+
+    Returns:
+    DataFrameProfile
+        Profile accepted by the ``profile=`` argument of every transform
+    """
+    if isinstance(df, pd.DataFrame):
+        if chunksize is None:
+            chunks = [df]
+        else:
+            chunks = (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize))
+    else:
+        chunks = df
+
+    result = DataFrameProfile()
+    for chunk in chunks:
+        if columns is not None:
+            chunk = chunk[list(columns)]
+        result.update(chunk, **options)
+    return result
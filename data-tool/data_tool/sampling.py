@@ -0,0 +1,144 @@
+"""
+Sampling-based approximate statistics with confidence intervals.
+
+Statistics are estimated from a uniform sample of row positions drawn
+without replacement, so their cost depends on the sample size and not on
+the number of rows. Columns no longer than the sample are computed exactly.
+"""
+
+import zlib
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+
+class ApproxStatistic:
+    """
+    Estimated statistic with a confidence interval.
+
+    For means and quantiles ``lower``/``upper`` bound the value itself; for
+    modes (``interval_of == 'frequency'``) they bound the share of non-null
+    rows holding the mode.
+    """
+
+    def __init__(self, name, value, lower, upper, sample_size, population_size,
+                 confidence, interval_of='value'):
+        self.name = name
+        self.value = value
+        self.lower = lower
+        self.upper = upper
+        self.sample_size = sample_size
+        self.population_size = population_size
+        self.confidence = confidence
+        self.interval_of = interval_of
+
+    @property
+    def exact(self):
+        return self.sample_size >= self.population_size
+
+    def __repr__(self):
+        return (
+            f"ApproxStatistic({self.name}={self.value!r}, "
+            f"{self.interval_of} in [{self.lower!r}, {self.upper!r}] "
+            f"@ {self.confidence:.0%}, n={self.sample_size}/{self.population_size})"
+        )
+
+
+class Sampler:
+    """
+    Draws reproducible column samples and estimates statistics from them.
+
+    Parameters:
+    sample_size : int, optional
+        Number of rows sampled per column
+    random_state : int, optional
+        Seed; combined with the column name so each column gets its own
+        deterministic sample
+    confidence : float, optional
+        Confidence level of the reported intervals
+    """
+
+    def __init__(self, sample_size=10_000, random_state=0, confidence=0.95):
+        if sample_size < 1:
+            raise ValueError(f"sample_size must be positive, got {sample_size}")
+        self.sample_size = sample_size
+        self.random_state = random_state
+        self.confidence = confidence
+        self.z = float(norm.ppf(0.5 + confidence / 2))
+        self.statistics = {}
+
+    def sample(self, series):
+        """Return (non-null sampled values, estimated non-null population size)."""
+        n = len(series)
+        if n <= self.sample_size:
+            values = series.dropna().to_numpy()
+            return values, len(values)
+        seed = [self.random_state, zlib.crc32(str(series.name).encode())]
+        positions = np.random.default_rng(seed).choice(n, self.sample_size, replace=False)
+        sample = series.iloc[np.sort(positions)]
+        values = sample.dropna().to_numpy()
+        return values, int(round(n * len(values) / self.sample_size))
+
+    def _record(self, column, stat):
+        self.statistics.setdefault(column, {})[stat.name] = stat
+        return stat
+
+    def mean(self, series):
+        values, population = self.sample(series)
+        values = values.astype(np.float64)
+        m = values.size
+        if m == 0:
+            return self._record(series.name, ApproxStatistic(
+                'mean', np.nan, np.nan, np.nan, 0, population, self.confidence))
+        mean = values.mean()
+        half = 0.0
+        if m < population and m > 1:
+            fpc = np.sqrt(1 - m / population)
+            half = self.z * values.std(ddof=1) / np.sqrt(m) * fpc
+        return self._record(series.name, ApproxStatistic(
+            'mean', mean, mean - half, mean + half, m, population, self.confidence))
+
+    def quantiles(self, series, qs, names=None):
+        """Estimate several quantiles from one sample of the column."""
+        values, population = self.sample(series)
+        values = np.sort(values.astype(np.float64))
+        m = values.size
+        names = names or [f'quantile_{q}' for q in qs]
+        result = []
+        for q, name in zip(qs, names):
+            if m == 0:
+                value = lower = upper = np.nan
+            elif m < population:
+                value = np.quantile(values, q)
+                # Distribution-free interval from the binomial distribution of ranks.
+                spread = self.z * np.sqrt(m * q * (1 - q))
+                lower = values[int(np.clip(np.floor(m * q - spread), 0, m - 1))]
+                upper = values[int(np.clip(np.ceil(m * q + spread), 0, m - 1))]
+            else:
+                value = lower = upper = np.quantile(values, q)
+            result.append(self._record(series.name, ApproxStatistic(
+                name, value, lower, upper, m, population, self.confidence)))
+        return result
+
+    def quantile(self, series, q):
+        return self.quantiles(series, [q])[0]
+
+    def median(self, series):
+        return self.quantiles(series, [0.5], names=['median'])[0]
+
+    def mode(self, series):
+        values, population = self.sample(series)
+        m = len(values)
+        if m == 0:
+            return self._record(series.name, ApproxStatistic(
+                'mode', None, np.nan, np.nan, 0, population, self.confidence, 'frequency'))
+        modes = pd.Series(values).mode()
+        value = modes[0]
+        share = np.count_nonzero(values == value) / m
+        half = 0.0
+        if m < population:
+            half = self.z * np.sqrt(share * (1 - share) / m)
+        return self._record(series.name, ApproxStatistic(
+            'mode', value, max(share - half, 0.0), min(share + half, 1.0),
+            m, population, self.confidence, 'frequency'))
@@ -1,8 +1,9 @@
+import numpy as np
 import pandas as pd
 from sklearn.preprocessing import MinMaxScaler, StandardScaler, RobustScaler
 
 
-def minmax_scale(df, columns):
+def minmax_scale(df, columns, profile=None):
     """
     Scale features to [0, 1] range.
     
@@ -11,18 +12,28 @@ def minmax_scale(df, columns):
         Input DataFrame
     columns : list
         Columns to scale
+    profile : DataFrameProfile, optional
+        Precomputed statistics used instead of fitting a scaler
         
     Returns:
     pandas.DataFrame
         Scaled DataFrame
     """
+    stats = _profile_stats(profile, columns)
+    if stats is not None:
+        return _affine_scale(
+            df, columns,
+            [p.min for p in stats],
+            [p.max - p.min for p in stats]
+        )
+
     scaler = MinMaxScaler()
     df_copy = df.copy()
     df_copy[columns] = scaler.fit_transform(df_copy[columns])
     return df_copy
 
 
-def standard_scale(df, columns):
+def standard_scale(df, columns, profile=None):
     """
     Standardize features (mean=0, std=1).
     
@@ -31,18 +42,28 @@ def standard_scale(df, columns):
         Input DataFrame
     columns : list
         Columns to scale
+    profile : DataFrameProfile, optional
+        Precomputed statistics used instead of fitting a scaler
         
     Returns:
     pandas.DataFrame
         Scaled DataFrame
     """
+    stats = _profile_stats(profile, columns)
+    if stats is not None:
+        return _affine_scale(
+            df, columns,
+            [p.mean for p in stats],
+            [p.std() for p in stats]
+        )
+
     scaler = StandardScaler()
     df_copy = df.copy()
     df_copy[columns] = scaler.fit_transform(df_copy[columns])
     return df_copy
 
 
-def robust_scale(df, columns):
+def robust_scale(df, columns, profile=None):
     """
     Scale features using robust statistics.
     
@@ -51,12 +72,42 @@ def robust_scale(df, columns):
         Input DataFrame
     columns : list
         Columns to scale
+    profile : DataFrameProfile, optional
+        Precomputed statistics used instead of fitting a scaler; the
+        quartiles are approximate (quantile sketch) once a column has more
+        non-null values than the profile's ``quantile_capacity`` (default 2048)
         
     Returns:
     pandas.DataFrame
         Scaled DataFrame
     """
+    stats = _profile_stats(profile, columns)
+    if stats is not None:
+        quartiles = [p.quantile([0.25, 0.5, 0.75]) for p in stats]
+        return _affine_scale(
+            df, columns,
+            [q[1] for q in quartiles],
+            [q[2] - q[0] for q in quartiles]
+        )
+
     scaler = RobustScaler()
     df_copy = df.copy()
     df_copy[columns] = scaler.fit_transform(df_copy[columns])
     return df_copy
+
+
+def _profile_stats(profile, columns):
+    """Column profiles for all columns, or None if any is missing."""
+    if profile is None or any(col not in profile for col in columns):
+        return None
+    return [profile[col] for col in columns]
+
+
+def _affine_scale(df, columns, center, scale):
+    """Compute (x - center) / scale, treating zero scale as 1 like scikit-learn."""
+    center = np.asarray(center, dtype=np.float64)
+    scale = np.asarray(scale, dtype=np.float64)
+    scale[scale == 0] = 1.0
+    df_copy = df.copy()
+    df_copy[columns] = (df_copy[columns].to_numpy(dtype=np.float64) - center) / scale
+    return df_copy
@@ -0,0 +1,249 @@
+"""
+Mergeable streaming sketches.
+
+Every sketch is updated with vectorized chunks of values and can be merged
+with another sketch of the same configuration, so summaries built over
+separate chunks or files combine into the summary of their concatenation.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _hash_values(values):
+    """Hash an array of values to uint64 with the pandas vectorized hasher."""
+    return pd.util.hash_array(np.asarray(values), categorize=False)
+
+
+def _bit_length(x):
+    """Vectorized ``int.bit_length`` for an array of uint64 values."""
+    x = x.copy()
+    length = np.zeros(x.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = x >= (np.uint64(1) << np.uint64(shift))
+        length[mask] += shift
+        x[mask] >>= np.uint64(shift)
+    return length + (x > 0)
+
+
+class HyperLogLog:
+    """
+    Approximate distinct counter.
+
+    Parameters:
+    precision : int, optional
+        Number of index bits; uses ``2 ** precision`` one-byte registers
+        and has a relative standard error of about ``1.04 / sqrt(2 ** precision)``
+    """
+
+    def __init__(self, precision=12):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be between 4 and 18, got {precision}")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values):
+        hashes = _hash_values(values)
+        if hashes.size == 0:
+            return self
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - p)) - 1)
+        rank = (64 - p) - _bit_length(rest) + 1
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+        return self
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        merged = HyperLogLog(self.precision)
+        merged.registers = np.maximum(self.registers, other.registers)
+        return merged
+
+    def estimate(self):
+        m = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return m * np.log(m / zeros)
+        return float(raw)
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch built from a hierarchy of compactors.
+
+    Values are kept exactly until more than ``capacity`` of them have been
+    seen; after that each full level is sorted and every other item is
+    promoted to the next level with twice the weight.
+
+    Parameters:
+    capacity : int, optional
+        Maximum number of items held per level
+    seed : int, optional
+        Seed for the random compaction offsets
+    """
+
+    def __init__(self, capacity=2048, seed=0):
+        if capacity < 2:
+            raise ValueError(f"capacity must be at least 2, got {capacity}")
+        self.capacity = capacity
+        self.count = 0
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def is_exact(self):
+        """True while no compaction has happened and quantiles are exact."""
+        return len(self.levels) == 1
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        self.count += values.size
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if level.size > self.capacity:
+                level = np.sort(level)
+                held = level.size % 2
+                offset = int(self._rng.integers(2))
+                promoted = level[offset:level.size - held:2]
+                self.levels[h] = level[level.size - held:]
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+            h += 1
+
+    def merge(self, other):
+        if other.capacity != self.capacity:
+            raise ValueError("Cannot merge quantile sketches with different capacity")
+        merged = QuantileSketch(self.capacity)
+        merged._rng = self._rng
+        merged.count = self.count + other.count
+        depth = max(len(self.levels), len(other.levels))
+        merged.levels = [
+            np.concatenate([
+                self.levels[h] if h < len(self.levels) else np.empty(0),
+                other.levels[h] if h < len(other.levels) else np.empty(0),
+            ])
+            for h in range(depth)
+        ]
+        merged._compress()
+        return merged
+
+    def quantile(self, q):
+        """
+        Estimate quantiles with linear interpolation semantics.
+
+        Exact (identical to ``numpy.quantile``) while ``is_exact`` is True.
+        """
+        q = np.asarray(q, dtype=np.float64)
+        if self.count == 0:
+            return np.full(q.shape, np.nan)[()]
+        if self.is_exact:
+            return np.quantile(self.levels[0], q)
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(level.size, 2.0 ** h) for h, level in enumerate(self.levels)
+        ])
+        order = np.argsort(values, kind='stable')
+        values = values[order]
+        cumulative = np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, q * (cumulative[-1] - 1), side='right')
+        return values[np.minimum(index, values.size - 1)][()]
+
+
+class HeavyHitters:
+    """
+    Mergeable Misra-Gries summary of the most frequent values.
+
+    Holds at most ``capacity`` counters. While fewer distinct values than
+    that have been seen the counts are exact; otherwise every stored count
+    underestimates the true frequency by at most ``error``.
+
+    Parameters:
+    capacity : int, optional
+        Maximum number of counters kept
+    """
+
+    def __init__(self, capacity=1024):
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.counts = pd.Series(dtype='int64')
+        self.total = 0
+        self.error = 0
+
+    @property
+    def is_exact(self):
+        """True while every distinct value seen so far has its exact count."""
+        return self.error == 0
+
+    def update(self, values):
+        chunk = pd.Series(values).value_counts(dropna=True, sort=False)
+        self.total += int(chunk.sum())
+        self._absorb(chunk)
+        return self
+
+    def _absorb(self, counts):
+        if len(self.counts) == 0:
+            combined = counts
+        elif len(counts) == 0:
+            combined = self.counts
+        else:
+            combined = self.counts.add(counts, fill_value=0)
+        combined = combined.astype('int64')
+        if len(combined) > self.capacity:
+            ordered = combined.sort_values(ascending=False, kind='stable')
+            threshold = int(ordered.iloc[self.capacity])
+            combined = ordered.iloc[:self.capacity] - threshold
+            combined = combined[combined > 0]
+            self.error += threshold
+        self.counts = combined
+
+    def merge(self, other):
+        merged = HeavyHitters(max(self.capacity, other.capacity))
+        merged.counts = self.counts
+        merged.total = self.total + other.total
+        merged.error = self.error + other.error
+        merged._absorb(other.counts)
+        return merged
+
+    def most_common(self, k=None):
+        """Return up to ``k`` values with their (lower-bound) counts, most frequent first."""
+        ordered = self.counts.sort_values(ascending=False, kind='stable')
+        return ordered if k is None else ordered.iloc[:k]
+
+    @property
+    def mode_is_exact(self):
+        """
+        True if ``mode()`` is certainly the most frequent value.
+
+        Holds while the counts are exact, or when the leading count beats
+        every other value even if their counts are underestimated by
+        ``error`` (values no longer stored occur at most ``error`` times).
+        """
+        if self.is_exact:
+            return True
+        ordered = self.most_common(2).to_numpy()
+        runner_up = ordered[1] if len(ordered) > 1 else 0
+        return len(ordered) > 0 and ordered[0] > runner_up + self.error
+
+    def mode(self):
+        """Most frequent value, ties broken like ``Series.mode`` (smallest value)."""
+        if len(self.counts) == 0:
+            return None
+        top = self.counts[self.counts == self.counts.max()].index
+        try:
+            return sorted(top)[0]
+        except TypeError:
+            return top[0]
@@ -0,0 +1,85 @@
+"""
+What the chunked and partitioned executors need to know about each step.
+
+Shared by ``memory.apply_with_memory_limit`` and
+``distributed.apply_dask``: which steps are row-local, which need global
+statistics from a profile, which columns a step reads, and whether a
+profile pins down the category sets of the encoders and the quantiles
+of clipped columns.
+"""
+
+import pandas as pd
+
+from .cleaning import handle_missing_values, remove_duplicates, clip_outliers
+from .encoding import one_hot_encode, label_encode, hash_encode
+from .scaling import minmax_scale, standard_scale, robust_scale
+
+ROW_LOCAL = {hash_encode}
+NEEDS_PROFILE = {
+    handle_missing_values, clip_outliers, one_hot_encode, label_encode,
+    minmax_scale, standard_scale, robust_scale
+}
+ENCODERS = {one_hot_encode, label_encode}
+
+
+def step_columns(func, df, kwargs):
+    """Columns a step reads, used to size it and to profile only what it needs."""
+    if func is handle_missing_values:
+        strategy = kwargs.get('strategy', 'drop')
+        if isinstance(strategy, dict):
+            return [col for col in strategy if col in df.columns]
+        columns = kwargs.get('columns')
+        return list(df.columns if columns is None else columns)
+    if func is clip_outliers:
+        column = kwargs['column']
+        if isinstance(column, (dict, list, tuple, pd.Index)):
+            return list(column)
+        return [column]
+    if func is remove_duplicates:
+        subset = kwargs.get('subset')
+        return list(df.columns if subset is None else subset)
+    return list(kwargs.get('columns', df.columns))
+
+
+def needs_exact_categories(func, kwargs):
+    """True if ``func`` encodes every distinct value, so chunks must share one vocabulary."""
+    return (
+        func in ENCODERS
+        and kwargs.get('max_categories') is None
+        and kwargs.get('min_frequency') is None
+    )
+
+
+def check_categories(func, profile, kwargs):
+    """
+    Raise ValueError if ``profile`` does not hold the full category set.
+
+    Without it every chunk or partition would fit its own labels or
+    dummy columns.
+    """
+    if not needs_exact_categories(func, kwargs):
+        return
+    for col in kwargs['columns']:
+        if profile[col].categories is None:
+            raise ValueError(
+                f"Column {col} has more distinct values than the profile tracks; "
+                f"profile with a larger max_heavy_hitters, set max_categories, or use hash_encode"
+            )
+
+
+def check_quantiles(func, profile, kwargs):
+    """
+    Raise ValueError if clip_outliers would clip a column without profile quantiles.
+
+    Quantiles are only sketched for numeric columns; any other column
+    (e.g. datetimes) would be clipped at each chunk's or partition's own
+    quantiles.
+    """
+    if func is not clip_outliers:
+        return
+    for col in step_columns(func, None, kwargs):
+        if not profile[col].numeric:
+            raise ValueError(
+                f"Column {col} is not numeric and has no profile quantiles; "
+                f"clip it with clip_outliers on the whole DataFrame"
+            )
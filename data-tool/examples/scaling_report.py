@@ -0,0 +1,37 @@
+"""
+Scaling Report for data-tool
+
+Runs every public transform on synthetic datasets of growing size and
+prints time / memory scaling, flagging functions that grow faster than
+linearly with the number of rows.
+
+Usage:
+    python scaling_report.py [max_rows]
+"""
+
+import sys
+
+from data_tool.benchmark import scaling_report, scaling_exponents, plot_scaling
+
+max_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+sizes = [n for n in (10_000, 30_000, 100_000, 300_000, 1_000_000, 3_000_000) if n <= max_rows]
+
+report = scaling_report(
+    sizes=sizes,
+    n_numeric=10,
+    n_categorical=4,
+    missing_rate=0.05,
+    outlier_rate=0.01,
+    duplicate_rate=0.02,
+    cardinality=200,
+    skew=1.1
+)
+print(report.to_string(index=False))
+print("\n" + "="*80 + "\n")
+print(scaling_exponents(report).sort_values('time_exponent', ascending=False))
+
+try:
+    plot_scaling(report, 'scaling_report.png')
+    print("\nPlot saved to 'scaling_report.png'")
+except ImportError:
+    print("\nInstall matplotlib to plot the scaling curves")
@@ -0,0 +1,30 @@
+import pytest
+import pandas as pd
+import numpy as np
+from data_tool.benchmark import scaling_report, scaling_exponents, default_cases, kernel_report
+
+def test_scaling_report_covers_all_functions():
+    report = scaling_report(sizes=(200, 400), repeat=1, n_numeric=2, n_categorical=1)
+    expected = set(default_cases(['num_0'], ['cat_0']))
+    assert set(report['function']) == expected
+    assert len(report) == 2 * len(expected)
+    assert (report['seconds'] > 0).all()
+    assert (report['peak_bytes'] > 0).all()
+
+def test_scaling_exponents_flag_superlinear():
+    report = pd.DataFrame({
+        'function': ['linear'] * 3 + ['quadratic'] * 3,
+        'n_rows': [10, 100, 1000] * 2,
+        'seconds': [1, 10, 100, 1, 100, 10000],
+        'peak_bytes': [1, 10, 100, 1, 10, 100],
+    })
+    exponents = scaling_exponents(report)
+    assert exponents.loc['linear', 'time_exponent'] == pytest.approx(1.0)
+    assert exponents.loc['quadratic', 'time_exponent'] == pytest.approx(2.0)
+    assert not exponents.loc['linear', 'superlinear']
+    assert exponents.loc['quadratic', 'superlinear']
+
+def test_kernel_report():
+    report = kernel_report(n_rows=1_000, repeat=1)
+    assert len(report) == 13
+    assert (report[['pandas_seconds', 'kernel_seconds']] > 0).all().all()
@@ -1,7 +1,8 @@
 import pytest
 import pandas as pd
 import numpy as np
-from data_tool.cleaning import handle_missing_values, remove_duplicates, clip_outliers
+from data_tool.cleaning import handle_missing_values, remove_duplicates, clip_outliers, near_duplicate_groups
+from data_tool.profiling import profile
 
 @pytest.fixture
 def sample_data():
@@ -20,6 +21,27 @@ def test_handle_missing_values_mean(sample_data):
     assert result['A'].isna().sum() == 0
     assert result['A'].mean() == pytest.approx(3.0)
 
+@pytest.mark.parametrize('fmt', ['bitmask', 'sparse'])
+def test_handle_missing_values_indicators(sample_data, fmt):
+    result, indicators = handle_missing_values(sample_data, strategy='median', indicators=fmt)
+    assert result.isna().sum().sum() == 0
+    assert indicators.columns == ['A', 'B', 'C']
+    assert indicators.column('A').tolist() == sample_data['A'].isna().tolist()
+    assert indicators.rows('B').tolist() == [0]
+    assert indicators.counts().tolist() == [1, 1, 0]
+    expected = sample_data.isna().add_suffix('_missing')
+    pd.testing.assert_frame_equal(indicators.to_frame(), expected)
+    assert (indicators.to_sparse().toarray() == sample_data.isna().to_numpy()).all()
+
+def test_handle_missing_values_indicators_packed_size():
+    df = pd.DataFrame(np.where(np.eye(1000, 20) > 0, np.nan, 1.0))
+    _, indicators = handle_missing_values(df, strategy='mean', indicators='bitmask')
+    assert indicators.nbytes == 20 * 125
+
+def test_handle_missing_values_indicators_reject_drop(sample_data):
+    with pytest.raises(ValueError):
+        handle_missing_values(sample_data, strategy='drop', indicators='bitmask')
+
 def test_remove_duplicates():
     df = pd.DataFrame({'A': [1, 1, 2], 'B': [3, 3, 4]})
     result = remove_duplicates(df)
@@ -78,3 +100,73 @@ def test_clip_outliers_no_downcasting():
 
     assert result['values'].max() < 1000
     assert result['floats'].max() < 1000.5
+
+def test_clip_outliers_multiple_columns_match_single_calls():
+    df = pd.DataFrame({
+        'A': [1, 2, 3, 4, 100],
+        'B': [1.5, -50.0, 2.5, 3.5, 4.5],
+        'C': [7, 7, 7, 7, 7]
+    })
+
+    result = clip_outliers(df, ['A', 'B', 'C'], method='iqr')
+    expected = df
+    for col in ['A', 'B', 'C']:
+        expected = clip_outliers(expected, col, method='iqr')
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert result['C'].tolist() == [7, 7, 7, 7, 7]
+    assert result['A'].dtype == df['A'].dtype
+
+def test_clip_outliers_per_column_settings():
+    df = pd.DataFrame({
+        'A': [1, 2, 3, 4, 100],
+        'B': [1.0, 2.0, 3.0, 4.0, 5.0]
+    })
+
+    result = clip_outliers(df, {
+        'A': 'iqr',
+        'B': {'method': 'quantile', 'lower_quantile': 0.25, 'upper_quantile': 0.75}
+    })
+
+    assert result['A'].max() < 100
+    assert result['B'].tolist() == [2.0, 2.0, 3.0, 4.0, 4.0]
+
+def test_clip_outliers_unknown_method():
+    df = pd.DataFrame({'A': [1, 2, 3]})
+    with pytest.raises(ValueError):
+        clip_outliers(df, {'A': 'zscore'})
+
+def test_clip_outliers_datetime_column():
+    times = pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-03', '2020-01-04', '2035-01-01'])
+    df = pd.DataFrame({'t': times, 'x': [1.0, 2.0, 3.0, 4.0, 100.0]})
+    result = clip_outliers(df, ['t', 'x'])
+    assert result['t'].dtype == df['t'].dtype
+    assert result['t'].iloc[-1] == pd.Timestamp('2020-01-07')
+    assert result['x'].tolist() == [1.0, 2.0, 3.0, 4.0, 7.0]
+    profiled = clip_outliers(df, ['t', 'x'], profile=profile(df))
+    pd.testing.assert_frame_equal(profiled, result)
+
+@pytest.fixture
+def customer_records():
+    return pd.DataFrame({
+        'name': ['John Smith', 'john  smith', 'Jon Smith', 'Alice Brown', 'Bob Stone', 'ALICE BROWN '],
+        'city': ['New York', 'new york', 'New York', 'Boston', 'Chicago', 'Boston'],
+        'id': [1, 2, 3, 4, 5, 6]
+    })
+
+def test_near_duplicate_groups(customer_records):
+    groups = near_duplicate_groups(customer_records, subset=['name', 'city'], threshold=0.6)
+    assert groups[0] == groups[1] == groups[2]
+    assert groups[3] == groups[5]
+    assert len({groups[0], groups[3], groups[4]}) == 3
+
+def test_remove_duplicates_minhash_keep(customer_records):
+    kwargs = dict(subset=['name', 'city'], method='minhash', threshold=0.6)
+    assert remove_duplicates(customer_records, **kwargs)['id'].tolist() == [1, 4, 5]
+    assert remove_duplicates(customer_records, keep='last', **kwargs)['id'].tolist() == [3, 5, 6]
+    assert remove_duplicates(customer_records, keep=False, **kwargs)['id'].tolist() == [5]
+
+def test_remove_duplicates_minhash_exact_copies_only_at_high_threshold(customer_records):
+    result = remove_duplicates(customer_records, subset=['name', 'city'], method='minhash', threshold=1.0)
+    # 'john  smith' / 'ALICE BROWN ' normalize to exact copies; the typo does not
+    assert result['id'].tolist() == [1, 3, 4, 5]
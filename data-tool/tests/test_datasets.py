@@ -0,0 +1,29 @@
+import pytest
+import pandas as pd
+import numpy as np
+from data_tool.datasets import make_dataset, write_dataset
+
+def test_make_dataset_shape_and_rates():
+    df = make_dataset(5000, n_numeric=2, n_categorical=1, missing_rate=0.1,
+                      duplicate_rate=0.05, cardinality=20, seed=1)
+    assert df.shape == (5000, 3)
+    assert list(df.columns) == ['num_0', 'num_1', 'cat_0']
+    assert df.isna().mean().between(0.08, 0.12).all()
+    assert df.duplicated().sum() >= 200
+    assert df['cat_0'].nunique() <= 20
+
+def test_make_dataset_outliers_and_skew():
+    df = make_dataset(5000, n_numeric=1, n_categorical=1, missing_rate=0,
+                      outlier_rate=0.02, duplicate_rate=0, skew=2.0, seed=2)
+    z = (df['num_0'] - df['num_0'].median()).abs() / 10
+    assert (z > 100).mean() == pytest.approx(0.02, abs=0.01)
+    counts = df['cat_0'].value_counts(normalize=True)
+    assert counts.iloc[0] > 0.5
+
+def test_make_dataset_is_reproducible():
+    pd.testing.assert_frame_equal(make_dataset(100, seed=3), make_dataset(100, seed=3))
+
+def test_write_dataset(tmp_path):
+    pytest.importorskip('pyarrow')
+    path = write_dataset(tmp_path / 'data.parquet', 250, chunksize=100, n_categorical=1)
+    assert len(pd.read_parquet(path)) == 250
@@ -0,0 +1,64 @@
+import pytest
+import pandas as pd
+import numpy as np
+from data_tool.cleaning import handle_missing_values, remove_duplicates, clip_outliers
+from data_tool.encoding import one_hot_encode
+from data_tool.scaling import standard_scale
+from data_tool.profiling import profile
+
+dd = pytest.importorskip('dask.dataframe')
+from data_tool.distributed import profile_dask, apply_dask
+
+@pytest.fixture
+def sample_data():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'x': rng.normal(size=400),
+        'city': rng.choice(['NY', 'LA', 'SF'], size=400)
+    })
+    df.loc[::7, 'x'] = np.nan
+    # the last partition never sees 'SF'
+    df.loc[300:, 'city'] = 'NY'
+    return df
+
+def test_profile_dask_matches_pandas(sample_data):
+    ddf = dd.from_pandas(sample_data, npartitions=4)
+    prof = profile_dask(ddf, split_every=2)
+    expected = profile(sample_data)
+    assert prof.n_rows == len(sample_data)
+    assert prof['x'].mean == pytest.approx(expected['x'].mean)
+    assert prof['x'].median() == pytest.approx(expected['x'].median())
+    assert prof['city'].categories == ['LA', 'NY', 'SF']
+
+def test_apply_dask_matches_pandas(sample_data):
+    ddf = dd.from_pandas(sample_data, npartitions=4)
+    data = ddf.compute()
+    cases = [
+        (handle_missing_values, {'strategy': 'mean', 'columns': ['x']}),
+        (clip_outliers, {'column': 'x', 'method': 'quantile'}),
+        (standard_scale, {'columns': ['x']}),
+        (one_hot_encode, {'columns': ['city']}),
+    ]
+    for func, kwargs in cases:
+        result = apply_dask(ddf, func, **kwargs).compute()
+        pd.testing.assert_frame_equal(result, func(data, **kwargs))
+
+def test_apply_dask_remove_duplicates():
+    df = pd.DataFrame({'a': [1, 1, 2, 2, 3], 'b': list('xxyyz')})
+    result = apply_dask(dd.from_pandas(df, npartitions=2), remove_duplicates).compute()
+    assert sorted(result['a'].tolist()) == [1, 2, 3]
+    with pytest.raises(NotImplementedError):
+        apply_dask(dd.from_pandas(df, npartitions=2), remove_duplicates, keep=False)
+
+def test_apply_dask_rejects_unsupported_options(sample_data):
+    ddf = dd.from_pandas(sample_data, npartitions=4)
+    with pytest.raises(NotImplementedError, match='indicators'):
+        apply_dask(ddf, handle_missing_values, strategy='mean', columns=['x'], indicators='bitmask')
+
+    times = pd.Series(pd.date_range('2020-01-01', periods=len(sample_data), freq='h'))
+    with pytest.raises(ValueError, match='not numeric'):
+        apply_dask(dd.from_pandas(sample_data.assign(t=times), npartitions=4),
+                   clip_outliers, column=['t'])
+    with pytest.raises(ValueError, match='mode'):
+        apply_dask(ddf, handle_missing_values, strategy={'x': 'mode'},
+                   profile=profile_dask(ddf, max_heavy_hitters=16))
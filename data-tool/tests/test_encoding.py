@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from data_tool.encoding import one_hot_encode, label_encode
+from data_tool.encoding import one_hot_encode, label_encode, hash_encode
 
 @pytest.fixture
 def sample_categorical_data():
@@ -90,3 +90,40 @@ def test_label_encode_preserves_numeric(sample_categorical_data):
     encoded = label_encode(sample_categorical_data, columns=['size'])
     assert encoded['price'].equals(sample_categorical_data['price'])
     assert encoded['color'].equals(sample_categorical_data['color'])
+
+def test_hash_encode_fixed_width(sample_categorical_data):
+    encoded = hash_encode(sample_categorical_data, columns=['color'], n_features=8)
+
+    hash_cols = [c for c in encoded.columns if c.startswith('color_hash_')]
+    assert len(hash_cols) == 8
+    assert 'color' not in encoded.columns
+    # exactly one non-zero bucket per row, equal values hash identically
+    assert (encoded[hash_cols].abs().sum(axis=1) == 1).all()
+    assert encoded.loc[0, hash_cols].tolist() == encoded.loc[4, hash_cols].tolist()
+    assert encoded['price'].equals(sample_categorical_data['price'])
+
+def test_hash_encode_sparse_matches_dense():
+    df = pd.DataFrame({'url': ['a', 'b', None, 'c', 'a']})
+    dense = hash_encode(df, columns=['url'], n_features=4)
+    sparse = hash_encode(df, columns=['url'], n_features=4, sparse=True)
+
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in sparse.dtypes)
+    np.testing.assert_array_equal(sparse.sparse.to_dense().to_numpy(), dense.to_numpy())
+    assert (dense.iloc[2] == 0).all()
+
+def test_one_hot_encode_max_categories():
+    df = pd.DataFrame({'city': ['NY'] * 4 + ['LA'] * 3 + ['SF', 'Rome', None]})
+    encoded = one_hot_encode(df, columns=['city'], max_categories=2)
+
+    assert [c for c in encoded.columns if c.startswith('city_')] == \
+        ['city_LA', 'city_NY', 'city___other__']
+    assert encoded['city___other__'].tolist() == [0] * 7 + [1, 1, 0]
+    assert encoded['city_NY'].sum() == 4
+
+def test_one_hot_encode_min_frequency():
+    df = pd.DataFrame({'city': ['NY'] * 4 + ['LA'] * 3 + ['SF', 'Rome', 'Oslo']})
+    by_count = one_hot_encode(df, columns=['city'], min_frequency=3)
+    by_fraction = one_hot_encode(df, columns=['city'], min_frequency=0.3)
+
+    pd.testing.assert_frame_equal(by_count, by_fraction)
+    assert by_count['city___other__'].sum() == 3
@@ -0,0 +1,66 @@
+import pytest
+import pandas as pd
+import numpy as np
+from data_tool.cleaning import handle_missing_values, clip_outliers
+from data_tool.scaling import minmax_scale, standard_scale, robust_scale
+from data_tool.fused import fused_numeric_transform
+
+@pytest.fixture
+def sample_data():
+    rng = np.random.default_rng(0)
+    values = rng.normal(50, 10, size=(200, 3))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    values[::37, 1] = 1000
+    df = pd.DataFrame(values, columns=['a', 'b', 'c'])
+    df['d'] = rng.integers(0, 10, size=200)
+    df['label'] = 'x'
+    return df
+
+SCALERS = {'minmax': minmax_scale, 'standard': standard_scale, 'robust': robust_scale}
+
+def _chained(df, columns, impute, clip, scale, **kwargs):
+    result = handle_missing_values(df, strategy=impute, columns=columns)
+    for col in columns:
+        result = clip_outliers(result, col, method=clip, **kwargs)
+    return SCALERS[scale](result, columns)
+
+@pytest.mark.parametrize('impute', ['mean', 'median', 'mode'])
+@pytest.mark.parametrize('clip', ['iqr', 'quantile'])
+@pytest.mark.parametrize('scale', ['minmax', 'standard', 'robust'])
+def test_fused_matches_chained_calls(sample_data, impute, clip, scale):
+    columns = ['a', 'b', 'c', 'd']
+    expected = _chained(sample_data, columns, impute, clip, scale)
+    result = fused_numeric_transform(
+        sample_data, columns, impute=impute, clip=clip, scale=scale, engine='numpy'
+    )
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-9)
+
+# the chained scalers warn about the all-NaN column
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('scale', ['minmax', 'standard', 'robust'])
+def test_fused_all_missing_column_without_imputation(scale):
+    df = pd.DataFrame({'a': [np.nan] * 4, 'b': [1.0, 2.0, 3.0, 4.0]})
+    result = fused_numeric_transform(df, ['a', 'b'], clip='iqr', scale=scale, engine='numpy')
+    expected = SCALERS[scale](df, ['a', 'b'])
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-9)
+
+def test_fused_writes_into_preallocated_output(sample_data):
+    out = np.empty((len(sample_data), 2))
+    result = fused_numeric_transform(
+        sample_data, ['a', 'b'], impute='median', scale='standard', out=out, engine='numpy'
+    )
+    np.testing.assert_array_equal(out, result[['a', 'b']].to_numpy())
+    assert result['label'].equals(sample_data['label'])
+
+def test_fused_clip_only_keeps_integer_dtype(sample_data):
+    result = fused_numeric_transform(sample_data, ['d'], clip='quantile', engine='numpy')
+    expected = clip_outliers(sample_data, 'd', method='quantile')
+    pd.testing.assert_frame_equal(result, expected)
+
+def test_fused_numba_engine_matches_numpy(sample_data):
+    pytest.importorskip('numba')
+    kwargs = dict(impute='mean', clip='iqr', scale='robust')
+    pd.testing.assert_frame_equal(
+        fused_numeric_transform(sample_data, ['a', 'b'], engine='numba', **kwargs),
+        fused_numeric_transform(sample_data, ['a', 'b'], engine='numpy', **kwargs)
+    )
@@ -0,0 +1,89 @@
+import threading
+import pytest
+import pandas as pd
+import numpy as np
+from data_tool.cleaning import handle_missing_values
+from data_tool.incremental import PartitionStore, run_incremental, transform_fingerprint
+
+def _partition(day):
+    return pd.DataFrame({'value': [day, np.nan, day + 2.0], 'day': [day] * 3})
+
+def _fill_constant(df, profile):
+    return handle_missing_values(df, strategy='constant', fill_value=0)
+
+def _fill_mean(df, profile):
+    return handle_missing_values(df, strategy='mean', columns=['value'], profile=profile)
+
+def test_rerun_reuses_everything(tmp_path):
+    partitions = {f'day{i}': _partition(i) for i in range(3)}
+    _, first = run_incremental(partitions, _fill_mean, str(tmp_path))
+    outputs, second = run_incremental(partitions, _fill_mean, PartitionStore(tmp_path))
+
+    assert first.outputs_computed == ['day0', 'day1', 'day2']
+    assert second.statistics_reused == ['day0', 'day1', 'day2']
+    assert second.outputs_reused == ['day0', 'day1', 'day2']
+    assert outputs['day1']['value'].tolist() == [1.0, 2.0, 3.0]
+
+def test_new_partition_only_recomputes_what_changed(tmp_path):
+    partitions = {f'day{i}': _partition(i) for i in range(3)}
+    run_incremental(partitions, _fill_constant, tmp_path, params=lambda prof: None)
+
+    partitions['day3'] = _partition(3)
+    _, report = run_incremental(partitions, _fill_constant, tmp_path, params=lambda prof: None)
+    assert report.statistics_computed == ['day3']
+    assert report.outputs_computed == ['day3']
+    assert report.outputs_reused == ['day0', 'day1', 'day2']
+
+def test_changed_global_statistics_recompute_dependent_outputs(tmp_path):
+    partitions = {f'day{i}': _partition(i) for i in range(3)}
+    run_incremental(partitions, _fill_mean, tmp_path)
+
+    partitions['day1'] = _partition(10)
+    del partitions['day2']
+    outputs, report = run_incremental(partitions, _fill_mean, tmp_path)
+
+    assert report.statistics_computed == ['day1']
+    assert report.statistics_reused == ['day0']
+    assert report.removed == ['day2']
+    assert report.params_changed
+    assert sorted(report.outputs_computed) == ['day0', 'day1']
+    # mean over the merged history of day0 and the new day1
+    assert outputs['day0']['value'].iloc[1] == pytest.approx(np.mean([0, 2, 10, 12]))
+
+def test_changed_transform_recomputes_outputs(tmp_path):
+    partitions = {f'day{i}': _partition(i) for i in range(2)}
+    run_incremental(partitions, _fill_mean, tmp_path)
+
+    outputs, report = run_incremental(
+        partitions, lambda df, prof: handle_missing_values(df, strategy='constant', fill_value=-99),
+        tmp_path)
+    assert report.outputs_computed == ['day0', 'day1']
+    assert outputs['day0']['value'].tolist() == [0.0, -99.0, 2.0]
+
+    fill = lambda value: lambda df, prof: handle_missing_values(df, strategy='constant', fill_value=value)
+    run_incremental(partitions, fill(-99), tmp_path)
+    _, report = run_incremental(partitions, fill(-1), tmp_path)
+    assert report.outputs_computed == ['day0', 'day1']
+    _, report = run_incremental(partitions, fill(-1), tmp_path, transform_key='v2')
+    _, report = run_incremental(partitions, fill(-2), tmp_path, transform_key='v2')
+    assert report.outputs_reused == ['day0', 'day1']
+
+def test_fingerprint_hashes_captured_values():
+    def shift_by(offsets):
+        return lambda df, prof: df + offsets[0]
+    offsets = np.zeros(2000)
+    changed = offsets.copy()
+    changed[500] = 1.0
+    # identical reprs: numpy elides the middle of long arrays
+    assert repr(offsets) == repr(changed)
+    assert transform_fingerprint(shift_by(offsets)) == transform_fingerprint(shift_by(offsets.copy()))
+    assert transform_fingerprint(shift_by(offsets)) != transform_fingerprint(shift_by(changed))
+
+def test_unpicklable_transform_needs_key(tmp_path):
+    lock = threading.Lock()
+    transform = lambda df, prof: lock and df
+    with pytest.raises(ValueError, match='transform_key'):
+        transform_fingerprint(transform)
+    partitions = {'day0': _partition(0)}
+    outputs, _ = run_incremental(partitions, transform, tmp_path, transform_key='v1')
+    pd.testing.assert_frame_equal(outputs['day0'], partitions['day0'])
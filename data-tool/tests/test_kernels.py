@@ -0,0 +1,74 @@
+import pytest
+import pandas as pd
+import numpy as np
+from data_tool import kernels, clip_outliers, handle_missing_values
+
+PROBS = [0.0, 0.05, 0.25, 0.5, 0.75, 0.95, 1.0]
+
+def make_columns(n, seed=0):
+    rng = np.random.default_rng(seed)
+    missing = rng.random(n) < 0.2
+    return {
+        'int_small_range': pd.Series(rng.integers(-5, 50, n)),
+        'int_wide_range': pd.Series(rng.integers(0, 10 ** 12, n)),
+        'uint8': pd.Series(rng.integers(0, 5, n).astype(np.uint8)),
+        'int8': pd.Series(rng.integers(-100, 100, n).astype(np.int8)),
+        'int16': pd.Series(rng.integers(-30_000, 30_000, n).astype(np.int16)),
+        'uint64_large': pd.Series(rng.integers(0, 50, n).astype(np.uint64) + np.uint64(2 ** 63 + 5)),
+        'nullable_uint64': pd.Series(rng.integers(0, 50, n).astype(np.uint64) + np.uint64(2 ** 63 + 5))
+            .astype('UInt64').mask(missing),
+        'bool': pd.Series(rng.random(n) < 0.3),
+        'nullable_bool': pd.Series(rng.random(n) < 0.3).astype('boolean').mask(missing),
+        'nullable_int': pd.Series(rng.integers(0, 9, n)).astype('Int64').mask(missing),
+        'float': pd.Series(rng.normal(size=n)).mask(missing),
+        'all_missing': pd.Series(np.nan, index=range(n)),
+    }
+
+@pytest.mark.parametrize('n', [1, 2, 11, 1000])
+def test_quantiles_and_median_match_pandas(n):
+    for name, series in make_columns(n).items():
+        # pandas cannot interpolate bools; compare with the 0/1 column
+        reference = series.astype('Float64') if series.dtype.kind == 'b' else series
+        expected = reference.quantile(PROBS).to_numpy(dtype=float, na_value=np.nan)
+        np.testing.assert_array_equal(kernels.quantiles(series, PROBS), expected, err_msg=name)
+        expected = reference.median()
+        result = kernels.median(series)
+        assert (pd.isna(result) and pd.isna(expected)) or result == expected, name
+
+@pytest.mark.parametrize('n', [1, 2, 11, 1000])
+def test_mode_matches_pandas(n):
+    columns = make_columns(n)
+    columns['categorical'] = pd.Series(np.random.default_rng(1).choice(['b', 'a', 'c'], n)).astype('category')
+    for name, series in columns.items():
+        modes = series.mode()
+        assert kernels.mode(series) == (modes[0] if len(modes) else None), name
+
+def test_kernels_do_not_modify_input():
+    series = pd.Series([5, 3, 9, 1, 7])
+    kernels.quantiles(series, [0.25, 0.75])
+    assert series.tolist() == [5, 3, 9, 1, 7]
+
+def test_mode_of_empty_categorical():
+    series = pd.Series([np.nan, np.nan]).astype(pd.CategoricalDtype(['x', 'y']))
+    assert kernels.mode(series) is None
+
+def test_narrow_int_and_bool_columns_in_transforms():
+    df = pd.DataFrame({'a': np.array([-100, 100, 0, 1, 2], dtype='int8')})
+    assert clip_outliers(df, 'a')['a'].tolist() == [-3, 5, 0, 1, 2]
+    assert handle_missing_values(df, strategy='mode')['a'].dtype == np.int8
+    df = pd.DataFrame({'flag': [True, False, True], 'x': [1.0, np.nan, 2.0]})
+    result = handle_missing_values(df, strategy='median')
+    assert result['x'].tolist() == [1.0, 1.5, 2.0]
+    assert result['flag'].tolist() == [True, False, True]
+
+def test_median_is_bit_identical_to_pandas():
+    rng = np.random.default_rng(3)
+    for _ in range(300):
+        series = pd.Series(rng.normal(size=int(rng.integers(2, 50))))
+        assert kernels.median(series) == series.median()
+
+def test_large_uint64_column_in_transforms():
+    df = pd.DataFrame({'u': np.array([2 ** 63 + 1, 2 ** 63 + 3, 2 ** 63 + 3], dtype=np.uint64)})
+    assert handle_missing_values(df, strategy='mode')['u'].tolist() == df['u'].tolist()
+    assert handle_missing_values(df, strategy='median')['u'].tolist() == df['u'].tolist()
+    assert clip_outliers(df, 'u')['u'].tolist() == df['u'].tolist()
@@ -0,0 +1,111 @@
+import pytest
+import pandas as pd
+import numpy as np
+from data_tool.cleaning import remove_duplicates, handle_missing_values, clip_outliers
+from data_tool.encoding import one_hot_encode, label_encode
+from data_tool.scaling import standard_scale, robust_scale
+from data_tool.memory import (
+    parse_memory, estimate_memory, choose_chunksize, apply_with_memory_limit
+)
+
+@pytest.fixture
+def sample_data():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'x': rng.normal(size=2000),
+        'y': rng.integers(0, 100, size=2000).astype(float),
+        'city': rng.choice(['NY', 'LA', 'SF', 'Rome'], size=2000)
+    })
+
+def test_parse_memory():
+    assert parse_memory(1024) == 1024
+    assert parse_memory('2KB') == 2000
+    assert parse_memory('1.5 GiB') == int(1.5 * 2 ** 30)
+    with pytest.raises(ValueError):
+        parse_memory('lots')
+
+def test_estimate_accounts_for_one_hot_width(sample_data):
+    narrow, _ = estimate_memory(sample_data, one_hot_encode, columns=['city'])
+    data = sample_data.assign(city=[f'c{i}' for i in range(len(sample_data))])
+    wide, output = estimate_memory(data, one_hot_encode, columns=['city'])
+    assert wide > 50 * narrow
+    assert output > 8 * len(data) * 1500
+
+def test_chunked_execution_matches_direct(sample_data):
+    for func, kwargs in [(standard_scale, {'columns': ['x', 'y']}),
+                         (one_hot_encode, {'columns': ['city']})]:
+        working, output = estimate_memory(sample_data, func, **kwargs)
+        # over the working-set estimate, but room for the concatenated output
+        limit = (working + 2 * output) // 2
+        assert choose_chunksize(sample_data, func, limit - 2 * output, **kwargs) < len(sample_data)
+
+        result = apply_with_memory_limit(sample_data, func, memory_limit=limit, **kwargs)
+        pd.testing.assert_frame_equal(result, func(sample_data, **kwargs))
+
+def test_overflow_modes(sample_data, tmp_path):
+    working, output = estimate_memory(sample_data, one_hot_encode, columns=['city'])
+    limit = output // 2
+
+    with pytest.raises(MemoryError):
+        apply_with_memory_limit(sample_data, one_hot_encode, limit, columns=['city'])
+
+    chunks = list(apply_with_memory_limit(sample_data, one_hot_encode, limit,
+                                          on_overflow='stream', columns=['city']))
+    assert len(chunks) > 1
+    assert sum(len(c) for c in chunks) == len(sample_data)
+
+    paths = apply_with_memory_limit(sample_data, one_hot_encode, limit, on_overflow='spill',
+                                    spill_dir=str(tmp_path), columns=['city'])
+    pd.testing.assert_frame_equal(pd.concat(pd.read_pickle(p) for p in paths), pd.concat(chunks))
+
+def test_non_chunkable_step_raises(sample_data):
+    with pytest.raises(MemoryError):
+        apply_with_memory_limit(sample_data, remove_duplicates, memory_limit=100)
+
+def test_chunked_encoding_high_cardinality():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({'city': [f'c{i}' for i in rng.integers(0, 1500, size=20_000)]})
+    working, output = estimate_memory(data, label_encode, columns=['city'])
+    result = apply_with_memory_limit(data, label_encode, (working + 2 * output) // 2, columns=['city'])
+    pd.testing.assert_frame_equal(result, label_encode(data, columns=['city']))
+
+    working, output = estimate_memory(data, one_hot_encode, columns=['city'])
+    chunks = list(apply_with_memory_limit(data, one_hot_encode, output // 2,
+                                          on_overflow='stream', columns=['city']))
+    assert len(chunks) > 1
+    pd.testing.assert_frame_equal(pd.concat(chunks), one_hot_encode(data, columns=['city']))
+
+@pytest.fixture
+def large_data():
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=20_000)
+    y = rng.integers(0, 5000, size=20_000).astype(float)
+    x[::10] = np.nan
+    y[::7] = np.nan
+    return pd.DataFrame({'x': x, 'y': y})
+
+def test_chunked_results_do_not_depend_on_budget(large_data):
+    steps = [
+        (handle_missing_values, {'strategy': {'x': 'median', 'y': 'mode'}}),
+        (handle_missing_values, {'strategy': 'mean'}),
+        (clip_outliers, {'column': ['x', 'y']}),
+        (robust_scale, {'columns': ['x', 'y']}),
+    ]
+    for func, kwargs in steps:
+        expected = func(large_data, **kwargs)
+        working, output = estimate_memory(large_data, func, **kwargs)
+        for limit in [(working + 2 * output) // 2, 2 * output + working // 10]:
+            result = apply_with_memory_limit(large_data, func, memory_limit=limit, **kwargs)
+            pd.testing.assert_frame_equal(result, expected)
+
+def test_chunked_quantiles_warn_when_approximate(large_data):
+    with pytest.warns(UserWarning, match='approximate'):
+        chunks = apply_with_memory_limit(large_data, clip_outliers, memory_limit=100_000,
+                                         on_overflow='stream', column=['x', 'y'])
+    assert sum(len(c) for c in chunks) == len(large_data)
+
+def test_chunked_imputation_rejects_indicators(large_data):
+    working, output = estimate_memory(large_data, handle_missing_values, strategy='mean')
+    with pytest.raises(ValueError, match='indicators'):
+        apply_with_memory_limit(large_data, handle_missing_values, memory_limit=working // 2,
+                                strategy='mean', indicators='bitmask')
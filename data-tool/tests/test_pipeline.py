@@ -0,0 +1,49 @@
+import pytest
+import pandas as pd
+import numpy as np
+from data_tool.cleaning import handle_missing_values
+from data_tool.pipeline import run_pipeline, read_chunks, ChunkWriter
+
+@pytest.fixture
+def chunks():
+    return [
+        pd.DataFrame({'A': [i, np.nan, i + 2.0], 'B': ['x', 'y', 'z']})
+        for i in range(5)
+    ]
+
+def test_run_pipeline_preserves_order_and_reports(chunks):
+    written = []
+    report = run_pipeline(
+        chunks,
+        lambda df: handle_missing_values(df, strategy='constant', fill_value=-1),
+        written.append,
+        max_queue=1
+    )
+
+    assert len(written) == 5
+    assert [df['A'].iloc[0] for df in written] == [0, 1, 2, 3, 4]
+    assert all(df['A'].iloc[1] == -1 for df in written)
+    for stage in ('read', 'transform', 'write'):
+        assert report[stage].chunks == 5
+        assert report[stage].rows == 15
+    assert set(report.to_frame().columns) >= {'rows', 'rows_per_second'}
+
+def test_run_pipeline_propagates_errors(chunks):
+    def failing(df):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_pipeline(chunks, failing, lambda df: None)
+
+def test_csv_round_trip(tmp_path, chunks):
+    source = tmp_path / 'in.csv'
+    target = tmp_path / 'out.csv'
+    pd.concat(chunks, ignore_index=True).to_csv(source, index=False)
+
+    with ChunkWriter(target) as writer:
+        report = run_pipeline(read_chunks(source, chunksize=4), lambda df: df.dropna(), writer)
+
+    result = pd.read_csv(target)
+    assert len(result) == 10
+    assert report['read'].rows == 15
+    assert report['write'].rows == 10
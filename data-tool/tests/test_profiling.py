@@ -0,0 +1,92 @@
+import pytest
+import pandas as pd
+import numpy as np
+from data_tool import profile, handle_missing_values, clip_outliers, one_hot_encode, label_encode
+from data_tool.scaling import minmax_scale, standard_scale, robust_scale
+
+@pytest.fixture
+def sample_data():
+    return pd.DataFrame({
+        'A': [1, 2, np.nan, 4, 5, 100],
+        'B': [np.nan, 2.5, 3.5, 4.5, 5.5, 6.5],
+        'city': ['NY', 'LA', np.nan, 'NY', 'SF', 'NY']
+    })
+
+def test_profile_basic_stats(sample_data):
+    prof = profile(sample_data)
+    a = prof['A']
+    assert a.count == 5
+    assert a.null_count == 1
+    assert a.min == 1 and a.max == 100
+    assert a.mean == pytest.approx(sample_data['A'].mean())
+    assert a.std(ddof=1) == pytest.approx(sample_data['A'].std())
+    assert a.median() == pytest.approx(sample_data['A'].median())
+    assert prof['city'].nunique == 3
+    assert prof['city'].mode() == 'NY'
+    assert prof['city'].categories == ['LA', 'NY', 'SF']
+
+def test_profile_merge_matches_single_pass(sample_data):
+    whole = profile(sample_data)
+    merged = profile(sample_data.iloc[:3]).merge(profile(sample_data.iloc[3:]))
+    chunked = profile(sample_data, chunksize=2)
+    for prof in (merged, chunked):
+        assert prof.n_rows == len(sample_data)
+        assert prof['A'].mean == pytest.approx(whole['A'].mean)
+        assert prof['A'].variance() == pytest.approx(whole['A'].variance())
+        assert prof['B'].quantile(0.25) == pytest.approx(whole['B'].quantile(0.25))
+        assert prof['city'].categories == whole['city'].categories
+
+def test_transforms_with_profile_match_scans(sample_data):
+    prof = profile(sample_data)
+    strategy = {'A': 'median', 'B': 'mean', 'city': 'mode'}
+    pd.testing.assert_frame_equal(
+        handle_missing_values(sample_data, strategy=strategy, profile=prof),
+        handle_missing_values(sample_data, strategy=strategy)
+    )
+    pd.testing.assert_frame_equal(
+        clip_outliers(sample_data, 'B', method='quantile', profile=prof),
+        clip_outliers(sample_data, 'B', method='quantile')
+    )
+    for scale in (minmax_scale, standard_scale, robust_scale):
+        pd.testing.assert_frame_equal(
+            scale(sample_data, ['A', 'B'], profile=prof),
+            scale(sample_data, ['A', 'B'])
+        )
+
+def test_encoders_with_profile_are_consistent_across_chunks(sample_data):
+    data = sample_data.dropna()
+    prof = profile(data)
+    chunk = data.iloc[:1]
+    encoded = one_hot_encode(chunk, ['city'], profile=prof)
+    assert [c for c in encoded.columns if c.startswith('city_')] == ['city_LA', 'city_NY', 'city_SF']
+    assert label_encode(data, ['city'], profile=prof)['city'].tolist() == \
+        label_encode(data, ['city'])['city'].tolist()
+
+def test_profile_unorderable_columns():
+    df = pd.DataFrame({
+        'color': pd.Categorical(['red', 'blue', None, 'red']),
+        'mixed': [1, 'x', None, 2.5],
+        'same': pd.Categorical(['z'] * 4)
+    })
+    prof = profile(df).merge(profile(df))
+    assert prof['color'].min is None and prof['mixed'].max is None
+    assert prof['color'].mode() == 'red'
+    assert prof['same'].is_constant and not prof['color'].is_constant
+    result = handle_missing_values(df, strategy={'color': 'mode'}, profile=prof)
+    assert result['color'].tolist() == ['red', 'blue', 'red', 'red']
+
+def test_inexact_mode_falls_back_to_scan():
+    values = np.arange(5000, dtype=np.float64)
+    values[::10] = np.nan
+    df = pd.DataFrame({'x': values})
+    prof = profile(df)
+    assert not prof['x'].mode_is_exact
+    result = handle_missing_values(df, 'mode', profile=prof)
+    pd.testing.assert_frame_equal(result, handle_missing_values(df, 'mode'))
+    assert result['x'].isna().sum() == 0
+
+def test_dominant_mode_is_exact_past_capacity():
+    values = np.concatenate([np.arange(3000), np.full(3000, -1)]).astype(np.float64)
+    prof = profile(pd.DataFrame({'x': values}))
+    assert not prof['x'].heavy_hitters.is_exact
+    assert prof['x'].mode_is_exact and prof['x'].mode() == -1
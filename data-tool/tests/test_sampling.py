@@ -0,0 +1,65 @@
+import pytest
+import pandas as pd
+import numpy as np
+from data_tool import handle_missing_values, clip_outliers
+from data_tool.sampling import Sampler
+
+@pytest.fixture
+def large_data():
+    rng = np.random.default_rng(0)
+    values = rng.normal(50, 10, 200_000)
+    values[rng.random(values.size) < 0.1] = np.nan
+    return pd.DataFrame({
+        'x': values,
+        'city': rng.choice(['NY', 'LA', 'SF'], values.size, p=[0.6, 0.3, 0.1])
+    })
+
+def test_sampled_median_interval_contains_exact(large_data):
+    stat = Sampler(sample_size=5_000).median(large_data['x'])
+    exact = large_data['x'].median()
+    assert not stat.exact
+    assert stat.lower <= exact <= stat.upper
+    assert stat.value == pytest.approx(exact, abs=1.0)
+
+def test_sampler_is_deterministic(large_data):
+    first = Sampler(sample_size=1_000, random_state=7).quantile(large_data['x'], 0.9)
+    second = Sampler(sample_size=1_000, random_state=7).quantile(large_data['x'], 0.9)
+    assert first.value == second.value
+
+def test_sampler_exact_for_short_columns():
+    series = pd.Series([1.0, 2.0, np.nan, 4.0], name='a')
+    stat = Sampler(sample_size=10).median(series)
+    assert stat.exact
+    assert stat.value == stat.lower == stat.upper == series.median()
+
+def test_handle_missing_values_approx(large_data):
+    result = handle_missing_values(large_data, strategy={'x': 'median', 'city': 'mode'},
+                                   approx=True, sample_size=2_000)
+    assert result.isna().sum().sum() == 0
+    stats = result.attrs['approx_statistics']
+    assert stats['city']['mode'].value == 'NY'
+    assert stats['x']['median'].lower <= large_data['x'].median() <= stats['x']['median'].upper
+
+def test_clip_outliers_approx(large_data):
+    exact = clip_outliers(large_data, 'x', method='quantile')
+    approx = clip_outliers(large_data, 'x', method='quantile', approx=True, sample_size=5_000)
+    assert approx['x'].max() == pytest.approx(exact['x'].max(), abs=1.0)
+    assert set(approx.attrs['approx_statistics']['x']) == {'quantile_0.05', 'quantile_0.95'}
+
+def test_clip_outliers_approx_mostly_constant_column():
+    values = np.zeros(100_000)
+    values[::10_000] = 1e6
+    df = pd.DataFrame({'x': values})
+    exact = clip_outliers(df, 'x')
+    approx = clip_outliers(df, 'x', approx=True, sample_size=1_000)
+    assert exact['x'].max() == 0
+    pd.testing.assert_frame_equal(approx, exact, check_like=True)
+
+def test_clip_outliers_approx_datetime_column(large_data):
+    times = pd.Timestamp('2020-01-01') + pd.to_timedelta(np.arange(len(large_data)), unit='min')
+    df = large_data.assign(t=times.where(np.arange(len(large_data)) != 7, pd.Timestamp('2099-01-01')))
+    exact = clip_outliers(df, ['t', 'x'])
+    approx = clip_outliers(df, ['t', 'x'], approx=True, sample_size=5_000)
+    assert approx['t'].dtype == df['t'].dtype
+    pd.testing.assert_series_equal(approx['t'], exact['t'])
+    assert set(approx.attrs['approx_statistics']) == {'x'}
@@ -0,0 +1,33 @@
+import pytest
+import pandas as pd
+import numpy as np
+from data_tool.sketches import HyperLogLog, QuantileSketch, HeavyHitters
+
+def test_hyperloglog_estimate_and_merge():
+    values = np.arange(20000)
+    left = HyperLogLog().update(values[:12000])
+    right = HyperLogLog().update(values[8000:])
+    assert left.merge(right).estimate() == pytest.approx(20000, rel=0.05)
+
+def test_quantile_sketch_exact_then_approximate():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=50000)
+    small = QuantileSketch().update(values[:100])
+    assert small.is_exact
+    assert small.quantile(0.3) == pytest.approx(np.quantile(values[:100], 0.3))
+
+    sketch = QuantileSketch(capacity=256)
+    for chunk in np.array_split(values, 10):
+        sketch.update(chunk)
+    assert not sketch.is_exact
+    assert sketch.count == values.size
+    assert sketch.quantile(0.5) == pytest.approx(np.median(values), abs=0.1)
+
+def test_heavy_hitters_keeps_frequent_values():
+    values = pd.Series(['a'] * 50 + ['b'] * 30 + [f'rare{i}' for i in range(40)])
+    hh = HeavyHitters(capacity=5)
+    for start in range(0, len(values), 16):
+        hh.update(values.iloc[start:start + 16])
+    assert not hh.is_exact
+    assert list(hh.most_common(2).index) == ['a', 'b']
+    assert hh.mode() == 'a'